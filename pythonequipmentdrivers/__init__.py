@@ -2,7 +2,7 @@ from . import (daq, errors, functiongenerator, multimeter, networkanalyzer,
                oscilloscope, powermeter, sink, source, temperaturecontroller,
                utility)
 from .core import (GpibInterface, VisaResource, find_visa_resources,
-                   identify_visa_resources)
+                   identify_visa_resources, query_many_async)
 from .resource_collections import ResourceCollection, connect_resources
 
 __all__ = [
@@ -10,6 +10,7 @@ __all__ = [
     "GpibInterface",
     "find_visa_resources",
     "identify_visa_resources",
+    "query_many_async",
     "connect_resources",
     "ResourceCollection",
     "utility",
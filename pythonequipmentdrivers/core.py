@@ -1,11 +1,37 @@
-from typing import Iterable, List, Optional, Tuple
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from time import monotonic, sleep
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import pyvisa
 
 from pythonequipmentdrivers.errors import ResourceConnectionError
 
 # Globals
-rm = pyvisa.ResourceManager()
+_rm: Optional[pyvisa.ResourceManager] = None  # created on first use
+
+
+def _get_resource_manager() -> pyvisa.ResourceManager:
+    """
+    _get_resource_manager()
+
+    Returns the shared VISA resource manager, creating it on first use.
+    Opening the resource manager loads the VISA library, so it is deferred
+    until a resource is actually accessed rather than done at import. The
+    manager is also available as the module attribute "rm".
+    """
+
+    global _rm
+    if _rm is None:
+        _rm = pyvisa.ResourceManager()
+    return _rm
+
+
+def __getattr__(name: str):
+    if name == "rm":
+        return _get_resource_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Utility Functions
@@ -18,7 +44,7 @@ def find_visa_resources(query: str = "?*::INSTR") -> Tuple[str]:
     Returns:
         Tuple[str]: Address strings for the connected Visa resources
     """
-    return rm.list_resources(query=query)
+    return _get_resource_manager().list_resources(query=query)
 
 
 def identify_visa_resources(
@@ -86,6 +112,28 @@ def identify_visa_resources(
     return visa_resources
 
 
+def query_many_async(queries: Iterable[Tuple["VisaResource", str]]) -> List[str]:
+    """
+    query_many_async(queries)
+
+    Sends queries to several resources concurrently and waits for all of the
+    responses. Queries to the same resource are still performed one at a time
+    in the order given (a single VISA session is never re-entered), so this
+    only reduces the total time when the queries are spread across different
+    instruments; it is then roughly the slowest response rather than the sum.
+
+    Args:
+        queries (Iterable[Tuple[VisaResource, str]]): (resource, message)
+            pairs to query
+
+    Returns:
+        List[str]: responses in the same order as queries
+    """
+
+    futures = [resource.query_resource_async(msg) for resource, msg in queries]
+    return [future.result() for future in futures]
+
+
 class VisaResource:
     """
     VisaResource
@@ -107,9 +155,23 @@ class VisaResource:
         timeout (float, optional): Timeout (in seconds) for I/O operations
             with the connected resource; resolves to the nearest millisecond.
             Defaults to 1.0.
+        fast_tcp (bool, optional): whether to tune TCP/IP connections for
+            low latency (see enable_fast_tcp). Defaults to False.
+        read_termination (str, optional): character(s) marking the end of a
+            response, required for raw socket sessions (::SOCKET) which have
+            no message framing. Defaults to the VISA library's setting.
+        write_termination (str, optional): character(s) appended to each
+            message written. Defaults to the VISA library's setting.
     """
 
     idn: str  # str: Description which uniquely identifies the instrument
+    _executor: Optional[ThreadPoolExecutor] = None  # see query_resource_async
+    _worker_ident: Optional[int] = None  # thread id of the _executor's worker
+
+    # whether multiple commands can be chained into a single message with ";"
+    supports_command_batching = False
+    _pending: Optional[List[str]] = None  # deferred writes within batch()
+    _pending_key: Optional[str] = None  # header of the last deferred write
 
     def __init__(self, address: str, clear: bool = False, **kwargs) -> None:
         self.address = address
@@ -118,9 +180,15 @@ class VisaResource:
             "open_timeout": int(1000 * kwargs.get("open_timeout", 1.0)),  # ms
             "timeout": int(1000 * kwargs.get("timeout", 1.0)),  # ms
         }
+        for setting in ("read_termination", "write_termination"):
+            if setting in kwargs:
+                default_settings[setting] = kwargs[setting]
 
         try:
+            rm = _get_resource_manager()
             self._resource = rm.open_resource(self.address, **default_settings)
+            if kwargs.get("fast_tcp", False):
+                self.enable_fast_tcp()
 
             self.idn = self.query_resource("*IDN?")
         except pyvisa.Error as error:
@@ -133,6 +201,31 @@ class VisaResource:
 
         self.timeout = int(1000 * kwargs.get("timeout", 1.0))  # ms
 
+    def enable_fast_tcp(self) -> None:
+        """
+        enable_fast_tcp()
+
+        For resources connected over TCP/IP, disables Nagle's algorithm
+        (VI_ATTR_TCPIP_NODELAY) so that short commands are sent immediately
+        rather than being held back to be coalesced with later data, which can
+        add tens of milliseconds to each query, and enables TCP keepalive
+        (VI_ATTR_TCPIP_KEEPALIVE) so idle connections aren't silently dropped.
+        Has no effect on other interfaces or VISA implementations which don't
+        support these attributes. Called on connection if the fast_tcp kwarg
+        is set.
+        """
+
+        if self._resource.interface_type != pyvisa.constants.InterfaceType.tcpip:
+            return
+        for attribute in (
+            pyvisa.constants.VI_ATTR_TCPIP_NODELAY,
+            pyvisa.constants.VI_ATTR_TCPIP_KEEPALIVE,
+        ):
+            try:
+                self._resource.set_visa_attribute(attribute, True)
+            except (pyvisa.VisaIOError, NotImplementedError):
+                pass  # attribute not supported by this VISA library/session
+
     def clear_status(self, **kwargs) -> None:
         """
         clear_status(**kwargs)
@@ -191,6 +284,85 @@ class VisaResource:
 
         self.write_resource("*RST", **kwargs)
 
+    def wait_complete(
+        self, timeout: Optional[float] = None, block: bool = True
+    ) -> None:
+        """
+        wait_complete(timeout=None, block=True)
+
+        Operation Complete barrier
+
+        If block is True the "*OPC?" query is sent, which the instrument only
+        answers once all preceding commands have completed; this call then
+        returns. A single barrier after a group of writes is cheaper than
+        confirming each write individually. If block is False "*WAI" is sent
+        instead, which makes the instrument finish all preceding commands
+        before executing any that follow without waiting here. Both are IEEE
+        488.2 Common Commands and should be supported by all SCPI compatible
+        instruments.
+
+        Args:
+            timeout (float, optional): Timeout (in seconds) used while waiting
+                for the response to "*OPC?", if None the current timeout is
+                used. Defaults to None.
+            block (bool, optional): whether to wait for the pending operations
+                to complete before returning. Defaults to True.
+        """
+
+        if not block:
+            self.write_resource("*WAI")
+            return
+
+        prior_timeout = self.timeout
+        if timeout is not None:
+            self.timeout = int(1000 * timeout)  # ms
+        try:
+            self.query_resource("*OPC?")
+        finally:
+            self.timeout = prior_timeout
+
+    def poll_complete(self, timeout: Optional[float] = None, interval=5e-3) -> None:
+        """
+        poll_complete(timeout=None, interval=5e-3)
+
+        Operation Complete barrier for instruments/firmware where "*OPC?"
+        can't be used (e.g. it blocks the bus or times out on long operations).
+        "*OPC" is sent with the Standard Event Status Enable register set so
+        that the operation complete event sets the ESB bit (0x20) of the
+        status byte, which is then polled with "*STB?" every interval seconds.
+        Returns as soon as the bit is set rather than after a worst-case
+        delay. The event register is cleared by reading "*ESR?" afterwards.
+        The Standard Event Status Enable register ("*ESE") is modified while
+        polling, its prior value is read first and restored before returning.
+
+        Args:
+            timeout (float, optional): maximum time (in seconds) to wait for
+                the pending operations to complete, if None the current
+                timeout is used. Defaults to None.
+            interval (float, optional): time (in seconds) between status byte
+                reads. Defaults to 5e-3.
+
+        Raises:
+            TimeoutError: the operations did not complete within timeout
+        """
+
+        if timeout is None:
+            timeout = self.timeout / 1000  # ms -> s
+        deadline = monotonic() + timeout
+
+        prior_ese = int(self.query_resource("*ESE?"))
+        self.write_resource("*ESE 1;*OPC")
+        try:
+            while not int(self.query_resource("*STB?")) & 0x20:
+                if monotonic() > deadline:
+                    raise TimeoutError(
+                        f"Pending operations did not complete within {timeout} s"
+                    )
+                sleep(interval)
+            self.query_resource("*ESR?")
+        finally:
+            self.write_resource(f"*ESE {prior_ese}")
+
     def set_local(self) -> None:
         """
         set_local()
@@ -232,6 +404,8 @@ class VisaResource:
         self._resource.timeout = int(timeout)  # ms
 
     def __del__(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
         if hasattr(self, "_resource"):
             self._resource.close()
 
@@ -245,21 +419,92 @@ class VisaResource:
     def __str__(self) -> str:
         return f"Resource ID: {self.idn}\nAddress: {self.address}"
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        batch()
+
+        Context manager which defers writes made within its block and sends
+        them as a single ";"-chained message when the block exits (or before
+        the next query, read or binary transfer). If the same setting is
+        written several times in a row (with no other command in between) only
+        the last value is sent, e.g.
+
+            with resource.batch():
+                for n in (10, 100, 1000):
+                    resource.write_resource(f"SAMP:COUN {n}")
+                resource.write_resource("TRIG:COUN 5")
+
+        sends a single "SAMP:COUN 1000;:TRIG:COUN 5". Commands without a single
+        parameter (i.e. *TRG) are never merged and the order of the commands
+        sent is always preserved. If the class does not set
+        supports_command_batching writes are sent immediately.
+        """
+
+        if (not self.supports_command_batching) or (self._pending is not None):
+            yield  # batching unsupported or already within a batch
+            return
+
+        self._pending = []
+        self._pending_key = None
+        try:
+            yield
+        finally:
+            try:
+                self._flush_pending()
+            finally:
+                self._pending = None
+
+    def _chain_commands(self, messages: List[str]) -> str:
+        # joins commands into a single message, each keeps its full header
+        return ";:".join(messages)
+
+    def _flush_pending(self) -> None:
+        if not self._pending:
+            return
+        message = self._chain_commands(self._pending)
+        self._pending.clear()
+        self._pending_key = None
+        self._send(message)
+
+    def _before_transfer(self) -> None:
+        # called before every read, query, raw or binary transfer so that any
+        # writes deferred until then reach the instrument first
+        self._flush_pending()
+
+    def _send(self, message: str, **kwargs) -> None:
+        # writes the message immediately, bypassing batch()
+        try:
+            self._resource.write(message=message, **kwargs)
+        except pyvisa.VisaIOError as error:
+            raise IOError("Error communicating with the resource\n", error)
+
     def write_resource(self, message: str, **kwargs) -> None:
         """
         write_resource(message, **kwargs)
 
-        Writes data to the connected resource.
+        Writes data to the connected resource. Within batch() the write is
+        deferred unless kwargs are given.
 
         Args:
             message (str): data to write to the connected resource, string of
                 ascii characters
         """
 
-        try:
-            self._resource.write(message=message, **kwargs)
-        except pyvisa.VisaIOError as error:
-            raise IOError("Error communicating with the resource\n", error)
+        if (self._pending is None) or kwargs:
+            self._flush_pending()
+            self._send(message, **kwargs)
+            return
+
+        header, _, args = message.partition(" ")
+        # only single-valued settings are merged, events/compound commands
+        # are always sent
+        key = header.upper() if (args and ("," not in args)) else None
+        if (key is not None) and (key == self._pending_key):
+            self._pending[-1] = message  # same setting as the last, later wins
+        else:
+            self._pending.append(message)
+        self._pending_key = key
 
     def write_resource_raw(self, message: bytes, **kwargs) -> None:
         """
@@ -271,11 +516,64 @@ class VisaResource:
             message (bytes): data to write to the connected resource
         """
 
+        self._before_transfer()
         try:
             self._resource.write_raw(message=message, **kwargs)
         except pyvisa.VisaIOError as error:
             raise IOError("Error communicating with the resource\n", error)
 
+    def write_resource_binary_values(
+        self, message: str, values: Iterable, **kwargs
+    ) -> None:
+        """
+        write_resource_binary_values(message, values, **kwargs)
+
+        Writes a command followed by the values encoded as an IEEE 488.2
+        definite length binary block to the connected resource.
+
+        Args:
+            message (str): command header preceding the data block, string of
+                ascii characters
+            values (Iterable): values to encode in the binary block
+        Kwargs:
+            datatype (str, optional): struct format character used to encode
+                each value. Defaults to "f".
+            is_big_endian (bool, optional): byte order of the encoded values.
+                Defaults to False.
+        """
+
+        self._before_transfer()
+        try:
+            self._resource.write_binary_values(message, values, **kwargs)
+        except pyvisa.VisaIOError as error:
+            raise IOError("Error communicating with the resource\n", error)
+
+    def write_resource_ascii_values(
+        self, message: str, values: Iterable, **kwargs
+    ) -> None:
+        """
+        write_resource_ascii_values(message, values, **kwargs)
+
+        Writes a command followed by the values formatted as separated ascii
+        text to the connected resource.
+
+        Args:
+            message (str): command header preceding the values, string of
+                ascii characters
+            values (Iterable): values to format
+        Kwargs:
+            converter (str, optional): format character used to convert each
+                value to text. Defaults to "f".
+            separator (str, optional): separator placed between values.
+                Defaults to ",".
+        """
+
+        self._before_transfer()
+        try:
+            self._resource.write_ascii_values(message, values, **kwargs)
+        except pyvisa.VisaIOError as error:
+            raise IOError("Error communicating with the resource\n", error)
+
     def query_resource(self, message: str, **kwargs) -> str:
         """
         query_resource(query, **kwargs)
@@ -293,6 +591,7 @@ class VisaResource:
                 ascii characters
         """
 
+        self._before_transfer()
         try:
             response: str = self._resource.query(message=message, **kwargs)
             return response.strip()
@@ -300,6 +599,91 @@ class VisaResource:
         except pyvisa.VisaIOError as error:
             raise IOError("Error communicating with the resource\n", error)
 
+    def query_resource_binary_values(self, message: str, **kwargs) -> Sequence:
+        """
+        query_resource_binary_values(message, **kwargs)
+
+        Writes a query to the connected resource and reads back a response
+        encoded as an IEEE 488.2 definite length binary block, decoding it
+        directly into values without an ascii conversion.
+
+        Args:
+            message (str): data to write to the connected resource before
+                issueing a read, string of ascii characters
+        Kwargs:
+            datatype (str, optional): struct format character used to decode
+                each value. Defaults to "f".
+            is_big_endian (bool, optional): byte order of the encoded values.
+                Defaults to False.
+            container (type, optional): type of the returned sequence, i.e.
+                np.ndarray. Defaults to list.
+        Returns:
+            Sequence: values decoded from the binary block
+        """
+
+        self._before_transfer()
+        try:
+            return self._resource.query_binary_values(message, **kwargs)
+        except pyvisa.VisaIOError as error:
+            raise IOError("Error communicating with the resource\n", error)
+
+    def query_resource_async(self, message: str, **kwargs) -> Future:
+        """
+        query_resource_async(message, **kwargs)
+
+        Performs query_resource in a background worker thread and returns
+        immediately. Each resource has a single worker, so asynchronous queries
+        to the same resource are performed one at a time in the order they
+        were submitted; this allows queries to several instruments to be in
+        flight at once. Avoid issuing synchronous reads/writes to the same
+        resource while its asynchronous queries are pending. For use with
+        asyncio the returned future can be wrapped with asyncio.wrap_future.
+
+        Args:
+            message (str): data to write to the connected resource before
+                issueing a read, string of ascii characters
+        Returns:
+            Future: resolves to the str returned by query_resource
+        """
+
+        return self._submit(self.query_resource, message, **kwargs)
+
+    def write_resource_async(self, message: str, **kwargs) -> Future:
+        """
+        write_resource_async(message, **kwargs)
+
+        Performs write_resource in the same background worker used by
+        query_resource_async and returns immediately. Writes and queries
+        submitted asynchronously to a resource are performed in the order they
+        were submitted; any error is raised when the future's result is
+        requested. For use with asyncio the returned future can be wrapped
+        with asyncio.wrap_future.
+
+        Args:
+            message (str): data to write to the connected resource, string of
+                ascii characters
+        Returns:
+            Future: resolves to None once the write has completed
+        """
+
+        return self._submit(self.write_resource, message, **kwargs)
+
+    def _submit(self, function, *args, **kwargs) -> Future:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=self.__class__.__name__,
+                initializer=self._init_worker,
+            )
+        return self._executor.submit(function, *args, **kwargs)
+
+    def _init_worker(self) -> None:
+        self._worker_ident = threading.get_ident()
+
+    def _on_worker(self) -> bool:
+        # whether the caller is running on this resource's background worker
+        return threading.get_ident() == self._worker_ident
+
     def read_resource(self, **kwargs) -> str:
         """
         read_resource(**kwargs)
@@ -311,6 +695,7 @@ class VisaResource:
                 ascii characters
         """
 
+        self._before_transfer()
         try:
             response: str = self._resource.read(**kwargs)
             return response.strip()
@@ -331,6 +716,7 @@ class VisaResource:
             bytes: data recieved from a connected resource
         """
 
+        self._before_transfer()
         try:
             response = self._resource.read_raw(**kwargs)
             return response
@@ -350,6 +736,7 @@ class VisaResource:
             bytes: data recieved from a connected resource
         """
 
+        self._before_transfer()
         try:
             response = self._resource.read_bytes(count=n, **kwargs)
             return response
@@ -358,6 +745,61 @@ class VisaResource:
             raise IOError("Error communicating with the resource\n", error)
 
 
+class ModeCacheMixin:
+    """
+    ModeCacheMixin
+
+    Mixin for VisaResource drivers which cache the instrument's measurement
+    mode, so that methods which check the mode don't need to query it every
+    time. The mode is read with the _mode_query query when first needed and
+    drivers update _mode when they change it. If the mode is changed by other
+    means (front panel, raw writes) use invalidate_cache or refresh_mode.
+    """
+
+    _mode_query: str  # query which returns the measurement mode
+    _mode: Optional[str] = None
+
+    def get_mode(self) -> str:
+        """
+        get_mode()
+
+        retrives type of measurement the instrument is currently configured to
+        perform. The mode is cached once known, see invalidate_cache.
+
+        returns: str
+        """
+
+        if self._mode is None:
+            self._mode = self.query_resource(self._mode_query).strip('"')
+        return self._mode
+
+    def refresh_mode(self) -> str:
+        """
+        refresh_mode()
+
+        Re-reads the measurement mode from the instrument, updating the cache.
+
+        returns: str
+        """
+
+        self._mode = None
+        return self.get_mode()
+
+    def invalidate_cache(self) -> None:
+        """
+        invalidate_cache()
+
+        Clears the cached settings so they're re-read from the instrument the
+        next time they're needed.
+        """
+
+        self._mode = None
+
+    def reset(self, **kwargs) -> None:
+        super().reset(**kwargs)
+        self.invalidate_cache()
+
+
 class GpibInterface:
     """
     GpibInterface
@@ -377,6 +819,7 @@ class GpibInterface:
         }
 
         try:
+            rm = _get_resource_manager()
             self._resource = rm.open_resource(self.address, **default_settings)
 
         except pyvisa.Error as error:
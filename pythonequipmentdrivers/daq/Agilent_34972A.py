@@ -265,8 +265,9 @@ class Agilent_34972A(VisaResource):
 
         Args:
             wait (bool, optional): Does not return to caller until scantime
-                                   is complete.  Prevents Trigger Ignored
-                                   errors (-211). Defaults to True.
+                                   is complete (the unit answers *OPC?).
+                                   Prevents Trigger Ignored errors (-211).
+                                   Defaults to True.
         """
         if self.trigger_mode == TriggerOptions.BUS:
             self.write_resource("*TRG", **kwargs)
@@ -276,11 +277,9 @@ class Agilent_34972A(VisaResource):
             )
 
         if wait:
-            # it should also wait nplc time per channel
-            # need to make a function to track nplc time
-            # if nplc is longer than 1, then this will fail, if shorter
-            # then this will take way too long
-            sleep(self.measure_time)  # should work most of the time.
+            # returns as soon as the scan completes, measure_time is only used
+            # to make sure long scans don't time out
+            self.wait_complete(timeout=max(2 * self.measure_time, self.timeout / 1000))
 
     def get_scan_list(self, **kwargs):
         """
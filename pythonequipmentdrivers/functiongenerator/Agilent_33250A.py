@@ -1,5 +1,9 @@
 from ..core import VisaResource
 
+_IMPEDANCE_OPTIONS = frozenset(("MIN", "MAX", "INF"))
+_BURST_MODES = frozenset(("TRIG", "GAT"))
+_NCYCLES_OPTIONS = frozenset(("INF", "MIN", "MAX"))
+
 
 class Agilent_33250A(VisaResource):
     """
@@ -11,26 +15,32 @@ class Agilent_33250A(VisaResource):
     generator
     """
 
-    valid_wave_types = ("SIN", "SQU", "RAMP", "PULSE", "NOIS", "DC", "USER")
+    valid_wave_types = frozenset(("SIN", "SQU", "RAMP", "PULSE", "NOIS", "DC", "USER"))
+
+    def _set_numeric(self, header: str, value: float) -> None:
+        # writes "<header> <value>" for settings which are a plain number
+        self.write_resource(f"{header} {float(value)}")
+
+    def _get_numeric(self, header: str) -> float:
+        response = self.query_resource(f"{header}?")
+        return float(response)
 
     def set_output_state(self, state: bool) -> None:
         self.write_resource(f"OUTP {1 if state else 0}")
 
     def get_output_state(self) -> bool:
         response = self.query_resource("OUTP?")
-        return bool(int(response))
+        return bool(float(response))
 
     def set_output_impedance(self, impedance) -> None:
         """
         Valid options are 1-10k, min, max, and inf
         """
 
-        valid_str = ("MIN", "MAX", "INF")
-
         if isinstance(impedance, (float, int)):
             z = min((max((impedance, 10)), 10e3))
             self.write_resource(f"OUTP:LOAD {z}")
-        elif isinstance(impedance, str) and (impedance.upper() in valid_str):
+        elif isinstance(impedance, str) and (impedance.upper() in _IMPEDANCE_OPTIONS):
             self.write_resource(f"OUTP:LOAD {impedance.upper()}")
 
     def get_output_impedance(self) -> float:
@@ -44,7 +54,7 @@ class Agilent_33250A(VisaResource):
             self.write_resource(f"FUNC {wave}")
         else:
             raise ValueError(
-                "Invalide Waveform type. " f"Supported: {self.valid_wave_types}"
+                "Invalide Waveform type. " f"Supported: {sorted(self.valid_wave_types)}"
             )
 
     def get_waveform_type(self) -> str:
@@ -52,39 +62,34 @@ class Agilent_33250A(VisaResource):
         return response.upper()
 
     def set_voltage_amplitude(self, voltage: float) -> None:
-        self.write_resource(f"VOLT {float(voltage)}")
+        self._set_numeric("VOLT", voltage)
 
     def get_voltage_amplitude(self) -> float:
-        response = self.query_resource("VOLT?")
-        return float(response)
+        return self._get_numeric("VOLT")
 
     def set_voltage_offset(self, voltage: float) -> None:
-        self.write_resource(f"VOLT:OFFS {float(voltage)}")
+        self._set_numeric("VOLT:OFFS", voltage)
 
     def get_voltage_offset(self) -> float:
-        response = self.query_resource("VOLT:OFFS?")
-        return float(response)
+        return self._get_numeric("VOLT:OFFS")
 
     def set_voltage_high(self, voltage: float) -> None:
-        self.write_resource(f"VOLT:HIGH {float(voltage)}")
+        self._set_numeric("VOLT:HIGH", voltage)
 
     def get_voltage_high(self) -> float:
-        response = self.query_resource("VOLT:HIGH?")
-        return float(response)
+        return self._get_numeric("VOLT:HIGH")
 
     def set_voltage_low(self, voltage: float) -> None:
-        self.write_resource(f"VOLT:LOW {float(voltage)}")
+        self._set_numeric("VOLT:LOW", voltage)
 
     def get_voltage_low(self) -> float:
-        response = self.query_resource("VOLT:LOW?")
-        return float(response)
+        return self._get_numeric("VOLT:LOW")
 
     def set_frequency(self, frequency: float) -> None:
-        self.write_resource(f"FREQ {float(frequency)}")
+        self._set_numeric("FREQ", frequency)
 
     def get_frequency(self) -> float:
-        response = self.query_resource("FREQ?")
-        return float(response)
+        return self._get_numeric("FREQ")
 
     def set_voltage_auto_range(self, state: bool) -> None:
         self.write_resource(f"VOLT:RANG:AUTO {'ON' if state else 'OFF'}")
@@ -97,35 +102,31 @@ class Agilent_33250A(VisaResource):
         self.write_resource(f"BURS:STAT {1 if state else 0}")
 
     def set_pulse_period(self, period: float) -> None:
-        self.write_resource(f"PULSE:PER {period}")
+        self._set_numeric("PULSE:PER", period)
 
-    def get_pulse_period(self):
-        response = self.query_resource("PULSE:PER?")
-        return float(response)
+    def get_pulse_period(self) -> float:
+        return self._get_numeric("PULSE:PER")
 
     def set_pulse_width(self, width: float) -> None:
-        self.write_resource(f"PULSE:WIDT {width}")
+        self._set_numeric("PULSE:WIDT", width)
 
     def get_pulse_width(self) -> float:
-        response = self.query_resource("PULSE:WIDT?")
-        return float(response)
+        return self._get_numeric("PULSE:WIDT")
 
     def set_square_duty_cycle(self, dc: float) -> None:
-        self.write_resource(f"FUNC:SQU:DCYCLE {dc}")
+        self._set_numeric("FUNC:SQU:DCYCLE", dc)
 
     def get_square_duty_cycle(self) -> float:
-        response = self.query_resource("FUNC:SQU:DCYCLE?")
-        return float(response)
+        return self._get_numeric("FUNC:SQU:DCYCLE")
 
     def get_burst_state(self, source: int = 1) -> bool:
         response = self.query_resource(f"SOUR{source}:BURS:STAT?")
-        return bool(int(response))
+        return bool(float(response))
 
     def set_burst_mode(self, mode: str) -> None:
         mode = mode.upper()
-        burst_modes = ("TRIG", "GAT")
-        if mode not in burst_modes:
-            raise ValueError(f"Invalid mode, valid modes are: {burst_modes}")
+        if mode not in _BURST_MODES:
+            raise ValueError(f"Invalid mode, valid modes are: {sorted(_BURST_MODES)}")
         self.write_resource(f"BURS:MODE {mode}")
 
     def get_burst_mode(self) -> str:
@@ -133,10 +134,9 @@ class Agilent_33250A(VisaResource):
         return response.lower()
 
     def set_burst_ncycles(self, ncycles: int) -> None:
-        str_options = ["INF", "MIN", "MAX"]
         if isinstance(ncycles, int):
             self.write_resource(f"BURS:NCYC {ncycles}")
-        elif isinstance(ncycles, str) and (ncycles.upper() in str_options):
+        elif isinstance(ncycles, str) and (ncycles.upper() in _NCYCLES_OPTIONS):
             self.write_resource(f"BURS:NCYC {ncycles.upper()}")
         else:
             raise ValueError("invalid entry for ncycles")
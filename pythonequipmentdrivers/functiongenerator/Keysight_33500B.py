@@ -1,7 +1,59 @@
-from typing import Generator, Iterable, List, Tuple, Union
+import re
+import threading
+from concurrent.futures import Future, wait
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
 
 from ..core import VisaResource
 
+_BURST_MODES = frozenset(("TRIG", "GAT"))
+_GATE_POLARITIES = frozenset(("NORM", "INV"))
+_PULSE_HOLD_PARAMS = frozenset(("DCYC", "WIDT"))
+_TRIG_SOURCES = frozenset(
+    ("IMM", "IMMEDIATE", "EXT", "EXTERNAL", "TIM", "TIMER", "BUS")
+)
+_MIN_MAX = frozenset(("MIN", "MAX"))
+_NCYCLES_OPTIONS = frozenset(("INF", "MIN", "MAX"))
+
+# i.e. '"SIN +1.0E+03,+1.0E-01,+0.0E+00"' -> wave type, freq, amp, offset
+_APPL_RESPONSE = re.compile(r'"?(\S+)\s+([^,]+),([^,]+),([^,"]+)"?')
+
+# aliases for the "which" arg of the pulse edge time methods -> SCPI suffix
+_EDGE_SUFFIX = {
+    "BOTH": "",
+    **dict.fromkeys(("RISE", "RISING", "R", "LEAD", "LEADING"), ":LEAD"),
+    **dict.fromkeys(("FALL", "FALLING", "F", "TRAIL", "TRAILING"), ":TRA"),
+}
+
+# (name, SCPI header relative to SOUR<n>, cast) for channel parameters which
+# are queried with "SOUR<n>:<header>?" and returned as a single value
+_QUERY_TABLE = (
+    ("voltage_amplitude", "VOLT:AMPL", float),
+    ("voltage_offset", "VOLT:OFFS", float),
+    ("voltage_high", "VOLT:HIGH", float),
+    ("voltage_low", "VOLT:LOW", float),
+    ("frequency", "FREQ", float),
+    ("pulse_dc", "FUNC:PULSE:DCYC", float),
+    ("pulse_width", "FUNC:PULSE:WIDT", float),
+    ("pulse_period", "FUNC:PULSE:PER", float),
+    ("square_dc", "FUNC:SQU:DCYC", float),
+    ("square_period", "FUNC:SQU:PER", float),
+    ("burst_phase", "BURS:PHASE", float),
+)
+
+
+def _make_getter(name: str, header: str, cast: Callable) -> Callable:
+    query = f"SOUR{{}}:{header}?".format
+
+    def getter(self, source: int = 1):
+        return cast(self.query_resource(query(source)))
+
+    getter.__name__ = f"get_{name}"
+    getter.__doc__ = f"get_{name}(source=1)\n\nQueries 'SOUR<source>:{header}?'"
+    return getter
+
 
 class Keysight_33500B(VisaResource):
     """
@@ -16,18 +68,116 @@ class Keysight_33500B(VisaResource):
     https://literature.cdn.keysight.com/litweb/pdf/33500-90901.pdf
     """
 
-    valid_wave_types = (
-        "ARB",
-        "DC",
-        "NOIS",
-        "PRBS",
-        "PULSE",
-        "RAMP",
-        "SIN",
-        "SQU",
-        "TRI",
+    valid_wave_types = frozenset(
+        ("ARB", "DC", "NOIS", "PRBS", "PULSE", "RAMP", "SIN", "SQU", "TRI")
     )
 
+    # whether multiple commands can be chained into a single message with ";"
+    supports_command_batching = True
+    # if False, chained commands are shortened relative to the SCPI path left
+    # by the previous command (i.e. "SOUR1:VOLT 1;VOLT:OFFS 0" rather than
+    # "SOUR1:VOLT 1;:SOUR1:VOLT:OFFS 0"), only use with firmware that tracks
+    # the current path correctly
+    strict_scpi_path = True
+
+    _tx_futures: Optional[List[Future]] = None  # writes sent within nowait()
+    _tx_lock: Optional[threading.Lock] = None  # guards _tx_futures
+
+    @contextmanager
+    def nowait(self) -> Iterator[None]:
+        """
+        nowait()
+
+        Context manager within which writes are handed to the resource's
+        background worker (see write_resource_async) and return immediately,
+        so the time spent sending one command overlaps with the code preparing
+        the next. Writes are still sent in order. Any read, query, raw or
+        binary transfer first waits for all queued writes to be sent (see
+        sync()), as does leaving the block. An error raised by a queued write
+        is re-raised by the next sync(). If the class does not support command
+        batching writes are sent immediately.
+        """
+
+        if (not self.supports_command_batching) or (self._tx_futures is not None):
+            yield  # pipelining unsupported or already within nowait()
+            return
+
+        if self._tx_lock is None:
+            self._tx_lock = threading.Lock()
+        self._tx_futures = []
+        try:
+            yield
+            self.sync()
+        finally:
+            with self._tx_lock:
+                futures, self._tx_futures = self._tx_futures, None
+            wait(futures)  # don't leave writes in flight after an error
+
+    def sync(self) -> None:
+        """
+        sync()
+
+        Waits until all writes queued within nowait() have been sent to the
+        instrument and re-raises the first error encountered while sending
+        them, if any. Has no effect outside of nowait(), or when called from
+        the resource's background worker (i.e. by query_resource_async) as
+        the queued writes are already ahead of it.
+        """
+
+        self._flush_pending()
+        if (self._tx_futures is None) or self._on_worker():
+            return
+
+        with self._tx_lock:
+            futures = self._tx_futures.copy()
+            self._tx_futures.clear()
+        for error in [future.exception() for future in futures]:  # waits
+            if error is not None:
+                raise error
+
+    def _before_transfer(self) -> None:
+        self.sync()
+
+    def _chain_commands(self, messages: Iterable[str]) -> str:
+        """
+        _chain_commands(messages)
+
+        Joins commands with absolute headers into a single ";"-separated
+        message. Unless strict_scpi_path is set, a header which extends the
+        path left by the previous command is sent relative to that path.
+        """
+
+        if self.strict_scpi_path:
+            return ";:".join(messages)
+
+        parts: List[str] = []
+        path: List[str] = []  # current SCPI path, header nodes but the last
+        for message in messages:
+            if message.startswith("*"):  # common commands don't change path
+                parts.append(message)
+                continue
+
+            header, sep, args = message.partition(" ")
+            nodes = header.upper().split(":")
+            depth = len(path)
+            if parts and (nodes[:depth] == path) and (len(nodes) > depth):
+                relative_header = ":".join(header.split(":")[depth:])
+                parts.append(f"{relative_header}{sep}{args}")
+            else:
+                parts.append(f":{message}" if parts else message)
+            path = nodes[:-1]
+
+        return ";".join(parts)
+
+    def _send(self, message: str, **kwargs) -> None:
+        if (self._tx_futures is not None) and not self._on_worker():
+            with self._tx_lock:
+                if self._tx_futures is not None:
+                    future = self._submit(super()._send, message, **kwargs)
+                    self._tx_futures.append(future)
+                    return
+        super()._send(message, **kwargs)
+
     def set_waveform_config(self, source: int = 1, **kwargs) -> None:
         """
         set_waveform_config(self, source, **kwargs)
@@ -49,10 +199,24 @@ class Keysight_33500B(VisaResource):
 
         """
 
-        wave_type = kwargs.get("wave_type", self.get_wave_type(source))
-        frequency = kwargs.get("frequency", self.get_frequency(source))
-        amplitude = kwargs.get("amplitude", self.get_voltage(source))
-        offset = kwargs.get("offset", self.get_voltage_offset(source))
+        queries = {
+            "wave_type": ("FUNC?", str.lower),
+            "frequency": ("FREQ?", float),
+            "amplitude": ("VOLT?", float),
+            "offset": ("VOLT:OFFS?", float),
+        }
+        missing = [key for key in queries if key not in kwargs]
+
+        config = {key: kwargs[key] for key in queries if key in kwargs}
+        if missing:
+            responses = self._query_many(source, [queries[k][0] for k in missing])
+            for key, response in zip(missing, responses):
+                config[key] = queries[key][1](response)
+
+        wave_type = config["wave_type"]
+        frequency = config["frequency"]
+        amplitude = config["amplitude"]
+        offset = config["offset"]
 
         self.write_resource(
             "SOUR{}:APPL:{} {}, {}, {}".format(
@@ -60,52 +224,56 @@ class Keysight_33500B(VisaResource):
             )
         )
 
+    def _query_many(self, source: int, subcmds: Iterable[str]) -> Tuple[str, ...]:
+        """
+        _query_many(source, subcmds)
+
+        Queries several parameters of a channel. If the class supports command
+        batching the queries are chained with semicolons and sent as a single
+        message (one round-trip), otherwise each is queried in turn.
+
+        Args:
+            source (int): Channel to query (1,2).
+            subcmds (Iterable[str]): queries relative to the SOUR{source}
+                subsystem, i.e. "FREQ?".
+
+        Returns:
+            Tuple[str, ...]: responses in the same order as subcmds
+        """
+
+        cmds = [f"SOUR{source}:{cmd}" for cmd in subcmds]
+
+        if not self.supports_command_batching:
+            return tuple(self.query_resource(cmd) for cmd in cmds)
+
+        response = self.query_resource(self._chain_commands(cmds))
+        return tuple(part.strip() for part in response.split(";"))
+
     def get_waveform_config(self, source: int = 1):
         response = self.query_resource(f"SOUR{source}:APPL?")
 
-        response = response.replace('"', "")
+        match = _APPL_RESPONSE.match(response)
+        if match is None:
+            raise IOError(f"Unexpected response to APPL? query: {response!r}")
 
-        wave_type, wave_info = response.split()
-
-        wave_type = wave_type.lower()
-        freq, amp, off = map(float, wave_info.split(","))
-        return (wave_type, freq, amp, off)
+        wave_type, freq, amp, off = match.groups()
+        return (wave_type.lower(), float(freq), float(amp), float(off))
 
     def set_voltage_amplitude(self, amplitude: float, source: int = 1) -> None:
         self.write_resource(f"SOUR{source}:VOLT:AMPL {amplitude}")
 
-    def get_voltage_amplitude(self, source: int = 1) -> float:
-        response = self.query_resource(f"SOUR{source}:VOLT:AMPL?")
-        return float(response)
-
     def set_voltage_offset(self, voltage: float, source: int = 1) -> None:
         self.write_resource(f"SOUR{source}:VOLT:OFFS {voltage}")
 
-    def get_voltage_offset(self, source: int = 1) -> float:
-        response = self.query_resource(f"SOUR{source}:VOLT:OFFS?")
-        return float(response)
-
     def set_voltage_high(self, voltage: float, source: int = 1) -> None:
         self.write_resource(f"SOUR{source}:VOLT:HIGH {voltage}")
 
-    def get_voltage_high(self, source: int = 1) -> float:
-        response = self.query_resource(f"SOUR{source}:VOLT:HIGH?")
-        return float(response)
-
     def set_voltage_low(self, voltage: float, source: int = 1) -> None:
         self.write_resource(f"SOUR{source}:VOLT:LOW {voltage}")
 
-    def get_voltage_low(self, source: int = 1) -> float:
-        response = self.query_resource(f"SOUR{source}:VOLT:LOW?")
-        return float(response)
-
     def set_frequency(self, frequency: float, source: int = 1) -> None:
         self.write_resource(f"SOUR{source}:FREQ {frequency}")
 
-    def get_frequency(self, source: int = 1) -> float:
-        response = self.query_resource(f"SOUR{source}:FREQ?")
-        return float(response)
-
     def set_wave_type(self, wave_type: str, source: int = 1) -> None:
         self.write_resource(f"SOUR{source}:FUNC {wave_type}")
 
@@ -117,62 +285,40 @@ class Keysight_33500B(VisaResource):
         dc = round(duty_cycle, 2)
         self.write_resource(f"SOUR{source}:FUNC:PULSE:DCYC {dc}")
 
-    def get_pulse_dc(self, source: int = 1) -> float:
-        response = self.query_resource(f"SOUR{source}:FUNC:PULSE:DCYC?")
-        return float(response)
-
     def set_pulse_width(self, width: float, source: int = 1) -> None:
         self.write_resource(f"SOUR{source}:FUNC:PULSE:WIDT {width}")
 
-    def get_pulse_width(self, source: int = 1) -> float:
-        response = self.query_resource(f"SOUR{source}:FUNC:PULSE:WIDT?")
-        return float(response)
-
     def set_pulse_period(self, period: float, source: int = 1) -> None:
         self.write_resource(f"SOUR{source}:FUNC:PULSE:PER {period}")
 
-    def get_pulse_period(self, source: int = 1) -> float:
-        response = self.query_resource(f"SOUR{source}:FUNC:PULSE:PER?")
-        return float(response)
-
     def set_pulse_edge_time(
         self, time: float, which: str = "both", source: int = 1
     ) -> None:
-
-        which = which.upper()
-        if which == "BOTH":
-            self.write_resource(f"SOUR{source}:FUNC:PULSE:TRAN {time}")
-
-        elif which in ["RISE", "RISING", "R", "LEAD", "LEADING"]:
-            self.write_resource(f"SOUR{source}:FUNC:PULSE:TRAN:LEAD {time}")
-
-        elif which in ["FALL", "FALLING", "F", "TRAIL", "TRAILING"]:
-            self.write_resource(f"SOUR{source}:FUNC:PULSE:TRAN:TRA {time}")
-        else:
-            raise ValueError('Invalid arguement for arg "which"')
+        try:
+            suffix = _EDGE_SUFFIX[which.upper()]
+        except KeyError:
+            raise ValueError('Invalid arguement for arg "which"') from None
+        self.write_resource(f"SOUR{source}:FUNC:PULSE:TRAN{suffix} {time}")
 
     def get_pulse_edge_time(self, which: str = "both", source: int = 1):
-        cmd_str = f"SOUR{source}:FUNC:PULSE:TRAN"
-        which = which.upper()
-        if which == "BOTH":
-            response = [
-                self.query_resource(f"{cmd_str}LEAD?"),
-                self.query_resource(f"{cmd_str}TRA?"),
-            ]
-        elif which in {"RISE", "RISING", "R", "LEAD", "LEADING"}:
-            response = self.query_resource(f"{cmd_str}LEAD?")
-        elif which in {"FALL", "FALLING", "F", "TRAIL", "TRAILING"}:
-            response = self.query_resource(f"{cmd_str}TRA?")
-        else:
-            raise ValueError('Invalid option for "which" arg')
-
-        if isinstance(response, list):
-            return tuple(map(float, response))
-        return float(response)
+        try:
+            suffix = _EDGE_SUFFIX[which.upper()]
+        except KeyError:
+            raise ValueError('Invalid option for "which" arg') from None
+
+        if suffix:
+            response = self.query_resource(f"SOUR{source}:FUNC:PULSE:TRAN{suffix}?")
+            return float(response)
+
+        # both edges in one round-trip
+        response = self._query_many(
+            source, ("FUNC:PULSE:TRAN:LEAD?", "FUNC:PULSE:TRAN:TRA?")
+        )
+        return tuple(map(float, response))
 
     def set_pulse_hold(self, param: str, source: int = 1) -> None:
         param = param.upper()
-        if param not in ["DCYC", "WIDT"]:
+        if param not in _PULSE_HOLD_PARAMS:
             raise ValueError(f"Invalid param {param}, must by 'DCYC'/'WIDT'")
         self.write_resource(f"SOUR{source}:FUNC:PULSE:HOLD {param}")
 
@@ -183,22 +329,13 @@ class Keysight_33500B(VisaResource):
     def set_square_dc(self, duty_cycle: float, source: int = 1) -> None:
         self.write_resource(f"SOUR{source}:FUNC:SQU:DCYC {duty_cycle}")
 
-    def get_square_dc(self, source: int = 1) -> float:
-        response = self.query_resource(f"SOUR{source}:FUNC:SQU:DCYC?")
-        return float(response)
-
     def set_square_period(self, period: float, source: int = 1) -> None:
         self.write_resource(f"SOUR{source}:FUNC:SQU:PER {period}")
 
-    def get_square_period(self, source: int = 1) -> float:
-        response = self.query_resource(f"SOUR{source}:FUNC:SQU:PER?")
-        return float(response)
-
     def set_burst_mode(self, mode: str, source: int = 1) -> None:
         mode = mode.upper()
-        burst_modes = ("TRIG", "GAT")
-        if mode not in burst_modes:
-            raise ValueError(f"Invalid mode, valid modes are: {burst_modes}")
+        if mode not in _BURST_MODES:
+            raise ValueError(f"Invalid mode, valid modes are: {sorted(_BURST_MODES)}")
         self.write_resource(f"SOUR{source}:BURS:MODE {mode}")
 
     def get_burst_mode(self, source: int = 1) -> str:
@@ -207,7 +344,7 @@ class Keysight_33500B(VisaResource):
 
     def set_burst_gate_polarity(self, polarity: str, source: int = 1) -> None:
         polarity = polarity.upper()
-        if polarity not in ["NORM", "INV"]:
+        if polarity not in _GATE_POLARITIES:
             raise ValueError('Invalid mode, valid modes are "NORM"/"INV"')
         self.write_resource(f"SOUR{source}:BURS:GATE:POL {polarity}")
 
@@ -216,10 +353,9 @@ class Keysight_33500B(VisaResource):
         return response.lower()
 
     def set_burst_ncycles(self, ncycles: int, source: int = 1) -> None:
-        str_options = ["INF", "MIN", "MAX"]
         if isinstance(ncycles, int):
             self.write_resource(f"SOUR{source}:BURS:NCYC {ncycles}")
-        elif isinstance(ncycles, str) and (ncycles.upper() in str_options):
+        elif isinstance(ncycles, str) and (ncycles.upper() in _NCYCLES_OPTIONS):
             self.write_resource(f"SOUR{source}:BURS:NCYC {ncycles.upper()}")
         else:
             raise ValueError("invalid entry for ncycles")
@@ -229,24 +365,19 @@ class Keysight_33500B(VisaResource):
         return int(float(response))
 
     def set_burst_phase(self, phase: float, source: int = 1) -> None:
-        str_options = ["MIN", "MAX"]
         if isinstance(phase, (float, int)):
             self.write_resource(f"SOUR{source}:BURS:PHASE {phase}")
-        elif isinstance(phase, str) and (phase.upper() in str_options):
+        elif isinstance(phase, str) and (phase.upper() in _MIN_MAX):
             self.write_resource(f"SOUR{source}:BURS:PHASE {phase.upper()}")
         else:
             raise ValueError("invalid entry for phase")
 
-    def get_burst_phase(self, source: int = 1) -> float:
-        response = self.query_resource(f"SOUR{source}:BURS:PHASE?")
-        return float(response)
-
     def set_burst_state(self, state: bool, source: int = 1) -> None:
         self.write_resource(f"SOUR{source}:BURS:STAT {1 if state else 0}")
 
     def get_burst_state(self, source: int = 1) -> bool:
         response = self.query_resource(f"SOUR{int(source)}:BURS:STAT?")
-        return bool(int(response))
+        return bool(float(response))
 
     def trigger(self, source: int = 1) -> None:
         self.write_resource(f"TRIG{int(source)}")
@@ -256,10 +387,9 @@ class Keysight_33500B(VisaResource):
         return int(float(response))
 
     def set_trigger_delay(self, delay: Union[float, int, str], source: int = 1) -> None:
-        str_options = ["MIN", "MAX"]
         if isinstance(delay, (float, int)):
             self.write_resource(f"TRIG{source}:DEL {delay}")
-        elif isinstance(delay, str) and (delay.upper() in str_options):
+        elif isinstance(delay, str) and (delay.upper() in _MIN_MAX):
             self.write_resource(f"TRIG{source}:DEL {delay.upper()}")
         else:
             raise ValueError("invalid entry for delay")
@@ -269,12 +399,11 @@ class Keysight_33500B(VisaResource):
         return float(response)
 
     def set_trigger_source(self, trig_source: str, source: int = 1) -> None:
-        trig_opts = {"IMM", "IMMEDIATE", "EXT", "EXTERNAL", "TIM", "TIMER", "BUS"}
         trig_source = trig_source.upper()
-        if trig_source in trig_opts:
+        if trig_source in _TRIG_SOURCES:
             self.write_resource(f"TRIG{source}:SOUR {trig_source}")
         else:
-            raise ValueError(f"Invalid arg for trig_source ({trig_opts})")
+            raise ValueError(f"Invalid arg for trig_source ({sorted(_TRIG_SOURCES)})")
 
     def get_trigger_source(self, source: int = 1) -> str:
         response = self.query_resource(f"TRIG{source}:SOUR?")
@@ -325,7 +454,7 @@ class Keysight_33500B(VisaResource):
 
     def get_output_state(self, source: int = 1) -> bool:
         response = self.query_resource(f"OUTP{int(source)}?")
-        return bool(int(response))
+        return bool(float(response))
 
     def set_output_impedance(self, impedance, source: int = 1) -> None:
         """Valid options are 1-10k, min, max, and inf"""
@@ -346,53 +475,41 @@ class Keysight_33500B(VisaResource):
         return self.set_display_text("")
 
     @staticmethod
-    def _clip_signal(
-        data: Iterable[float], val_min: float, val_max: float
-    ) -> Generator[float, None, None]:
-        """
-        _clip_signal(data, val_min, val_max)
-
-        Clips the values of the iterable data to the range [val_min, val_max].
-        values within this range are passed unmodifed.
-
-        Args:
-            data (Iterable[float]): A series of values to clip
-            val_min (float): minimum value of output
-            val_max (float): maximum value of output
-
-        Yields:
-            Generator[float, None, None]: input sequence clipped to the
-                specified range.
-        """
-
-        for x in data:
-            yield min(max(x, val_min), val_max)
-
-    @staticmethod
-    def _normalize(data: Iterable[float]) -> Generator[float, None, None]:
+    def _to_dac_codes(data: Iterable[float], full_scale: int = 32767) -> np.ndarray:
         """
-        _normalize(data)
+        _to_dac_codes(data, full_scale=32767)
 
-        Normalized the input sequence to the range +/- 1.
+        Normalizes the input sequence to the range +/- full_scale and rounds it
+        to 16-bit DAC codes. The offset and scale are applied in place on a
+        single float32 buffer.
 
         Args:
             data (Iterable[float]): series of values to normalize
+            full_scale (int, optional): DAC code corresponding to a normalized
+                value of 1. Defaults to 32767.
 
-        Yields:
-            Generator[float, None, None]: normalized sequence
+        Returns:
+            np.ndarray: normalized sequence as int16 DAC codes
         """
 
-        val_min = min(data)
-        val_max = max(data)
+        samples = np.array(data, dtype=np.float32)
+
+        val_min = samples.min()
+        val_max = samples.max()
+        half_span = (val_max - val_min) / 2
 
-        norm_val = max(abs(val_min), abs(val_max))
-        mid_val = (val_max + val_min) / 2
+        samples -= (val_max + val_min) / 2
+        if half_span > 0:
+            np.multiply(samples, full_scale / half_span, out=samples)
+        np.rint(samples, out=samples)
 
-        for x in data:
-            yield (x - mid_val) / (norm_val + mid_val)
+        return samples.astype(np.int16)
 
-    def store_arbitrary_waveform(self, data: Iterable[float], arb_name: str) -> None:
+    def store_arbitrary_waveform(
+        self, data: Iterable[float], arb_name: str, encoding: str = "binary"
+    ) -> None:
         """
+        store_arbitrary_waveform(data, arb_name, encoding="binary")
 
         Stores an arbitrary waveform to the volatile memory of the function
         generator. The waveform will be stored as a normalized sequence (-1,
@@ -403,17 +520,32 @@ class Keysight_33500B(VisaResource):
         Args:
             data (Iterable[float]): arbitrary waveform sequence
             arb_name (str): alias used to access the saved waveform
+            encoding (str, optional): how the DAC codes are transferred,
+                'binary' (2 bytes/sample) or 'ascii' (comma separated text)
+                for interfaces which cannot pass 8-bit data. Defaults to
+                'binary'.
         """
 
+        encoding = encoding.lower()
+        if encoding not in {"binary", "ascii"}:
+            raise ValueError("encoding must be either 'binary' or 'ascii'")
+
         if not (8 < len(data) < 65536):
             raise ValueError("data must be between 8 and 65536 samples")
 
-        # send data
-        self.write_resource(
-            "SOUR:DATA:ARB1 {},{}".format(
-                arb_name,
-                ",".join(map(str, self._clip_signal(self._normalize(data), -1, 1))),
+        dac_codes = self._to_dac_codes(data)
+        cmd_str = f"SOUR:DATA:ARB1:DAC {arb_name},"
+
+        if encoding == "ascii":
+            self.write_resource_ascii_values(
+                cmd_str, dac_codes, converter="d", separator=","
             )
+            return
+
+        # send data as a little-endian binary block, 2 bytes per sample
+        self.write_resource("FORM:BORD SWAP")
+        self.write_resource_binary_values(
+            cmd_str, dac_codes, datatype="h", is_big_endian=False
         )
 
     def get_stored_waveform_names(self, source: int = 1) -> List[str]:
@@ -533,3 +665,8 @@ class Keysight_33500B(VisaResource):
             error_queue.append((error_code, error_string))
 
         return error_queue
+
+
+for _name, _header, _cast in _QUERY_TABLE:
+    setattr(Keysight_33500B, f"get_{_name}", _make_getter(_name, _header, _cast))
+del _name, _header, _cast
@@ -1,9 +1,13 @@
-from typing import Union
+import threading
+from bisect import bisect_left
+from concurrent.futures import Future
+from typing import List, Optional, Union
 
+import numpy as np
 import pyvisa
 from pyvisa.constants import BufferOperation
 
-from ..core import VisaResource, rm
+from ..core import ModeCacheMixin, VisaResource
 
 
 class Fluke45SerialError(Exception):
@@ -12,14 +16,28 @@ class Fluke45SerialError(Exception):
     """
 
 
-class Fluke_45(VisaResource):
+# serial prompt -> error description (None if the command succeeded)
+_ACK_ACTIONS = {
+    b"=>\r\n": None,
+    b"?>\r\n": "a command error",
+    b"!>\r\n": "an execution error",
+}
+_ACK_LENGTH = 4  # two prompt characters plus the "\r\n" termination
+
+
+class Fluke_45(ModeCacheMixin, VisaResource):
     """
-    Fluke_45(address, factor=1, legacy_ranges=True)
+    Fluke_45(address, factor=1, legacy_ranges=True, strict_mode_check=True)
 
     address : str, address of the connected multimeter
 
     factor: float, multiplicitive scale for all measurements defaults to 1.
 
+    strict_mode_check: bool, if true (default) the measure_* methods verify
+    the meter is in the matching mode before returning a measurement. If
+    false the check is skipped entirely, for sweeps where the mode is set once
+    up front.
+
     legacy_ranges: bool, if true (default) traditional integer range values
     are used per the Fluke 45 manual. If false, the range value related to the
     measurement magnitude. A range will be set that is >= the specified
@@ -36,7 +54,15 @@ class Fluke_45(VisaResource):
     http://www.ece.ubc.ca/~eng-services/files/manuals/Man_DMM_fluke45.pdf
     """
 
-    valid_modes = ("AAC", "ADC", "VAC", "VDC", "OHMS", "FREQ", "CONT")
+    # whether the meter accepts multiple ";"-separated commands on one line
+    supports_command_batching = True
+    # limit on chained queries per line, keeps lines within the input buffer
+    _max_queries_per_line = 32
+
+    _VALID_MODES_DISPLAY = ("AAC", "ADC", "VAC", "VDC", "OHMS", "FREQ", "CONT")
+    valid_modes = frozenset(_VALID_MODES_DISPLAY)
+    _mode_query = "FUNC1?"
+    _VALID_RATES = frozenset(("S", "M", "F"))
     ranges = [
         (
             {"VDC", "VAC"},
@@ -89,73 +115,91 @@ class Fluke_45(VisaResource):
         ),
     ]
 
+    # (mode, rate) -> ((max values, ascending), (range numbers)) from ranges
+    _range_lut = {
+        (mode, rate): tuple(zip(*sorted(max_values)))
+        for valid_modes, rates_list in ranges
+        for valid_rates, max_values in rates_list
+        for mode in valid_modes
+        for rate in valid_rates
+    }
+
     def __init__(self, address: str, legacy_ranges: bool = True, **kwargs) -> None:
         # must be set before calling parent constructor
         self._is_serial = True if "asrl" in address.lower() else False
         self._legacy_ranges = legacy_ranges
+        self._io_lock = threading.RLock()  # serializes write/prompt-read pairs
+        self.invalidate_cache()  # no mode/rate known yet
         super().__init__(address, **kwargs)
         self.factor = kwargs.get("factor", 1.0)
+        self.strict_mode_check = kwargs.get("strict_mode_check", True)
+
+        # read each response in as few low-level transfers as possible
+        self._resource.chunk_size = 65536
 
         # now do the rest of the preparations for a serial Fluke 45
         if self._is_serial:
-            # self._flush_receive_buffer()
-            visa_resource = self._get_visa_resource()
-            visa_resource.flush(BufferOperation.discard_receive_buffer)
-            visa_resource.write_termination = "\r\n"
-            visa_resource.read_termination = "\r\n"
-
-    def _check_serial_response(self, message: str, resp: str) -> None:
-        if resp == "=>":
-            return
-        elif resp == "?>":
-            raise Fluke45SerialError(f"{repr(message)} resulted in a command error")
-        elif resp == "!>":
-            raise Fluke45SerialError(f"{repr(message)} resulted in an execution error")
-        else:
-            raise Fluke45SerialError(f"{repr(message)} resulted in an unknown error")
-
-    def _get_visa_resource(self) -> pyvisa.resources.Resource:
-        """Obtain the device's visa resource without accessing protected members of parent class"""
-        for resource in rm.list_opened_resources():
-            if resource.resource_name == self.address:
-                return resource
-        raise RuntimeError("Unable to find a resource matching the device")
-
-    def _flush_receive_buffer(self):
-        """alternate method for flushing the receive buffer"""
-        # ensure RS232 buffer is empty
-        try:
-            # ensure exit of loop, not sure if the read buffer is even big
-            # enough for 256 query responses
-            max_reads = 256
-            read_cnt = 0
-            while read_cnt <= max_reads:
-                self.read_resource()
-                read_cnt += 1
-
-        # meter will not respond to reads if the buffer is empty
-        except IOError:
-            pass  # emptied
-
-    def write_resource(self, message: str, **kwargs) -> None:
-        """
-        Fluke45 specific write_resource function
+            self._flush_receive_buffer()
+            self._resource.write_termination = "\r\n"
+            self._resource.read_termination = "\r\n"
+
+    def _check_serial_response(self, message: str) -> None:
+        # the prompt has a fixed length, read it as raw bytes in one transfer
+        # rather than scanning for the termination and decoding it
+        resp = self.read_resource_bytes(_ACK_LENGTH)
+        error = _ACK_ACTIONS.get(resp, "an unknown error")
+        if error:
+            raise Fluke45SerialError(f"{message!r} resulted in {error}")
+
+    def _flush_receive_buffer(self) -> None:
+        """discard any pending data in the receive buffer with a single call"""
+        with self._io_lock:
+            try:
+                self._resource.flush(BufferOperation.discard_receive_buffer)
+            except pyvisa.Error as error:
+                raise IOError("Error communicating with the resource\n", error)
+
+    def _chain_commands(self, messages: List[str]) -> str:
+        return ";".join(messages)  # no SCPI header paths to reset
+
+    def _send(self, message: str, **kwargs) -> None:
+        """
+        Fluke45 specific write function (used by write_resource and batch)
         takes care of serial response if the device uses serial
+
+        Over RS-232 the meter answers every command line with a prompt ("=>",
+        "?>", or "!>") which cannot be disabled; it is the only indication of
+        whether the command succeeded and must be consumed to keep later
+        responses in sync, so it is read here rather than discarded.
+
+        The write and prompt read are performed under a per-instrument lock so
+        the instrument can be shared between threads (i.e. used from a
+        ThreadPoolExecutor) without another thread's I/O interleaving.
         """
-        super().write_resource(message, **kwargs)
-        if self._is_serial:
-            self._check_serial_response(message, self.read_resource())
+        with self._io_lock:
+            super()._send(message, **kwargs)
+            if self._is_serial:
+                self._check_serial_response(message)
 
     def query_resource(self, message: str, **kwargs) -> str:
         """
         Fluke45 specific query_resource function
         takes care of serial response if the device uses serial
+
+        Over RS-232 the prompt follows the query response on its own line, it
+        is already in the receive buffer by the time the response is read.
+        Like write_resource this is performed under the per-instrument lock.
         """
-        response = super().query_resource(message, **kwargs)
-        if self._is_serial:
-            self._check_serial_response(message, self.read_resource())
+        with self._io_lock:
+            response = super().query_resource(message, **kwargs)
+            if self._is_serial:
+                self._check_serial_response(message)
         return response
 
+    def read_resource(self, **kwargs) -> str:
+        with self._io_lock:
+            return super().read_resource(**kwargs)
+
     def fetch_data(self) -> float:
         """
         fetch_data()
@@ -170,6 +214,33 @@ class Fluke_45(VisaResource):
 
         return self.factor * float(response)
 
+    def fetch_data_many(self, n: int) -> np.ndarray:
+        """
+        fetch_data_many(n)
+
+        returns n values of the current measurement selected on the multimeter
+        display. Each sample is triggered with *TRG before it's read with VAL?,
+        so the meter must be set to the external trigger source (see
+        set_trigger_source) for the readings to be distinct. When
+        supports_command_batching is set the trigger/read pairs are chained on
+        shared command lines (up to _max_queries_per_line per line) so the
+        readings arrive in a few round-trips rather than n.
+
+        n: int, number of values to fetch
+
+        returns: np.ndarray
+        """
+
+        per_line = self._max_queries_per_line if self.supports_command_batching else 1
+
+        responses = []
+        for start in range(0, n, per_line):
+            count = min(per_line, n - start)
+            response = self.query_resource(";".join(["*TRG;VAL?"] * count))
+            responses.extend(response.split(";"))
+
+        return self.factor * np.array(responses, dtype=float)
+
     def enable_cmd_emulation_mode(self) -> None:
         """
         enable_cmd_emulation_mode()
@@ -179,34 +250,43 @@ class Fluke_45(VisaResource):
         """
         self.write_resource("L2")
 
-    def set_local(self):
+    def set_local(self, block: bool = True) -> Optional[Future]:
         """
-        set_local()
+        set_local(block=True)
 
         Set the DMM to local mode
+
+        block: bool, if False on a serial connection the command is sent (and
+            its prompt checked) in the background and a Future for the write
+            is returned immediately, see write_resource_async.
+
+        returns: None or Future
         """
         if self._is_serial:
             # there is a specific serial command
+            if not block:
+                return self.write_resource_async("LOCS")
             self.write_resource("LOCS")
         else:
             # use the GPIB method
             super().set_local()
 
-    def _get_range_number(self, value, reverse_lookup=False):
-        mode = self.get_mode()
-        rate = self.get_rate()
-        for valid_modes, rates_list in self.ranges:
-            if mode not in valid_modes:
-                continue
-            for valid_rates, max_values in rates_list:
-                if rate not in valid_rates:
-                    continue
-                for range_, command in max_values:
-                    if value <= range_ and not reverse_lookup:
-                        return command
-                    elif command == value and reverse_lookup:
-                        return range_
-                raise ValueError(f"{value=} is greater than highest range")
+    def _get_range_number(self, value, reverse_lookup=False, mode=None, rate=None):
+        mode = mode or self.get_mode()
+        rate = rate or self.get_rate()
+        lut = self._range_lut.get((mode, rate))
+        if lut is None:
+            return None  # mode has no ranges
+        max_values, commands = lut
+
+        if reverse_lookup:
+            if value in commands:
+                return max_values[commands.index(value)]
+        else:
+            idx = bisect_left(max_values, value)  # first range >= value
+            if idx < len(commands):
+                return commands[idx]
+        raise ValueError(f"{value=} is greater than highest range")
 
     def set_range(self, n: Union[int, float], auto_range: bool = False) -> None:
         """
@@ -231,13 +311,15 @@ class Fluke_45(VisaResource):
             self.write_resource("AUTO")
             return
 
+        self.write_resource(f"RANGE {self._validate_range(n)}")
+
+    def _validate_range(self, n: Union[int, float], mode=None, rate=None) -> int:
         if not self._legacy_ranges:
-            n = self._get_range_number(n)
+            n = self._get_range_number(n, mode=mode, rate=rate)
 
-        if n in range(0, 7):
-            self.write_resource(f"RANGE {n}")
-        else:
-            raise ValueError("Invalid range option, should be 1-7")
+        if isinstance(n, (int, float)) and (1 <= n <= 7) and (n == int(n)):
+            return int(n)
+        raise ValueError("Invalid range option, should be 1-7")
 
     def get_range(self) -> Union[int, float]:
         """
@@ -269,24 +351,31 @@ class Fluke_45(VisaResource):
         adjusts the sampling rate for multimeter measurements
         """
 
-        rate = rate.upper()
-        if rate in {"S", "M", "F"}:
-            self.write_resource(f"RATE {rate}")
+        rate = self._validate_rate(rate)
+        self.write_resource(f"RATE {rate}")
+        self._rate = rate
 
-        else:
-            raise ValueError("Invalid rate option, should be 'S','M', or 'F'")
+    def _validate_rate(self, rate: str) -> str:
+        if rate in self._VALID_RATES:  # already canonical, skip the copy
+            return rate
+        rate = rate.upper()
+        if rate in self._VALID_RATES:
+            return rate
+        raise ValueError("Invalid rate option, should be 'S','M', or 'F'")
 
     def get_rate(self) -> str:
         """
         get_rate()
 
-        Retrives the sampling rate setting for multimeter measurements
+        Retrives the sampling rate setting for multimeter measurements. The
+        rate is cached once known, see invalidate_cache.
         returns: str
         """
 
-        response = self.query_resource("RATE?")
+        if self._rate is None:
+            self._rate = self.query_resource("RATE?")
 
-        return response
+        return self._rate
 
     def set_mode(self, mode: str) -> None:
         """
@@ -301,29 +390,57 @@ class Fluke_45(VisaResource):
         Configures the multimeter to perform the specified measurement
         """
 
+        mode = self._validate_mode(mode)
+        self.write_resource(f"{mode}")
+        self._mode = mode
+
+    def _validate_mode(self, mode: str) -> str:
+        if mode in self.valid_modes:  # already canonical, skip the copy
+            return mode
         mode = mode.upper()
         if mode in self.valid_modes:
-            self.write_resource(f"{mode}")
+            return mode
+        raise ValueError(
+            "Invalid mode option, valid options are: "
+            + f"{', '.join(self._VALID_MODES_DISPLAY)}"
+        )
 
-        else:
-            raise ValueError(
-                "Invalid mode option, valid options are: "
-                + f"{', '.join(self.valid_modes)}"
-            )
+    def invalidate_cache(self) -> None:
+        """
+        invalidate_cache()
 
-    def get_mode(self) -> str:
+        Clears the cached mode and sampling rate.
         """
-        get_mode()
 
-        retrives type of measurement the multimeter is current configured to
-        perform.
+        super().invalidate_cache()
+        self._rate = None
 
-        returns: str
+    def _measure(self, mode: str, quantity: str) -> float:
+        """
+        _measure(mode, quantity)
+
+        Returns the current measurement if the meter is in the given mode,
+        otherwise raises an IOError. The cached mode is checked when known;
+        if not the mode and measurement are queried together in one message
+        (when supports_command_batching is set). No check is made if
+        strict_mode_check is False.
         """
 
-        response = self.query_resource("FUNC1?")
+        if not self.strict_mode_check:
+            return self.fetch_data()
 
-        return response
+        if self._mode is None and self.supports_command_batching:
+            mode_response, response = self.query_resource("FUNC1?;VAL?").split(";")
+            self._mode = mode_response.strip()
+        else:
+            response = None
+
+        if self.get_mode() != mode:
+            raise IOError(f"Multimeter is not configured to measure {quantity}")
+
+        if response is None:
+            return self.fetch_data()
+        return self.factor * float(response)
 
     def measure_voltage(self) -> float:
         """
@@ -337,9 +454,7 @@ class Fluke_45(VisaResource):
         set_mode method.
         """
 
-        if self.get_mode() != "VDC":
-            raise IOError("Multimeter is not configured to measure voltage")
-        return self.fetch_data()
+        return self._measure("VDC", "voltage")
 
     def measure_voltage_rms(self) -> float:
         """
@@ -353,9 +468,7 @@ class Fluke_45(VisaResource):
         set_mode method.
         """
 
-        if self.get_mode() != "VAC":
-            raise IOError("Multimeter is not configured to measure AC voltage")
-        return self.fetch_data()
+        return self._measure("VAC", "AC voltage")
 
     def measure_current(self) -> float:
         """
@@ -369,9 +482,7 @@ class Fluke_45(VisaResource):
         mode with the set_mode method.
         """
 
-        if self.get_mode() != "ADC":
-            raise IOError("Multimeter is not configured to measure current")
-        return self.fetch_data()
+        return self._measure("ADC", "current")
 
     def measure_current_rms(self) -> float:
         """
@@ -385,9 +496,7 @@ class Fluke_45(VisaResource):
         mode with the set_mode method.
         """
 
-        if self.get_mode() != "AAC":
-            raise IOError("Multimeter is not configured to measure AC current")
-        return self.fetch_data()
+        return self._measure("AAC", "AC current")
 
     def measure_resistance(self) -> float:
         """
@@ -401,9 +510,7 @@ class Fluke_45(VisaResource):
         set_mode method.
         """
 
-        if self.get_mode() != "OHMS":
-            raise IOError("Multimeter is not configured to measure resistance")
-        return self.fetch_data()
+        return self._measure("OHMS", "resistance")
 
     def measure_frequency(self) -> float:
         """
@@ -417,9 +524,7 @@ class Fluke_45(VisaResource):
         set_mode method.
         """
 
-        if self.get_mode() != "FREQ":
-            raise IOError("Multimeter is not configured to measure frequency")
-        return self.fetch_data()
+        return self._measure("FREQ", "frequency")
 
     def set_trigger_source(self, trigger: str) -> None:
         """
@@ -436,17 +541,31 @@ class Fluke_45(VisaResource):
         trigger_type_num = 2 if "ext" in trigger.lower() else 1
         self.write_resource(f"TRIGGER {trigger_type_num}")
 
-    def trigger(self) -> None:
+    def trigger(self, block: bool = True) -> Optional[Future]:
         """
-        trigger()
+        trigger(block=True)
 
         Send the trigger commmand
+
+        block: bool, if False the command is sent (and on serial its prompt
+            checked) in the background and a Future for the write is returned
+            immediately, see write_resource_async.
+
+        returns: None or Future
         """
+        if not block:
+            return self.write_resource_async("*TRG")
         self.write_resource("*TRG")
 
-    def config(self, mode: str, rate: str, signal_range: Union[int, float]):
+    def config(
+        self,
+        mode: str,
+        rate: str,
+        signal_range: Union[int, float],
+        batched: bool = True,
+    ):
         """
-        config(mode, rate, range_)
+        config(mode, rate, range_, batched=True)
 
         A one stop shop to configure the most common operating parameters
 
@@ -466,7 +585,23 @@ class Fluke_45(VisaResource):
                 If legacy_ranges==False then the value of n should be the max
                 measurement value that is expected. The DMM will be set to a
                 range that is >= n.
+            batched (bool, optional): if True (and supports_command_batching
+                is set) the settings are validated locally and sent as a
+                single command line, otherwise each is set individually.
+                Defaults to True.
         """
-        self.set_mode(mode)
-        self.set_rate(rate)
-        self.set_range(signal_range)
+        self.invalidate_cache()
+
+        if not (batched and self.supports_command_batching):
+            self.set_mode(mode)
+            self.set_rate(rate)
+            self.set_range(signal_range)
+            return
+
+        mode = self._validate_mode(mode)
+        rate = self._validate_rate(rate)
+        n = self._validate_range(signal_range, mode=mode, rate=rate)
+
+        self.write_resource(f"{mode};RATE {rate};RANGE {n}")
+        self._mode = mode
+        self._rate = rate
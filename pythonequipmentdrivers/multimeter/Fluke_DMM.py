@@ -1,9 +1,7 @@
-from typing import Set
+from ..core import ModeCacheMixin, VisaResource
 
-from ..core import VisaResource
 
-
-class Fluke_DMM(VisaResource):
+class Fluke_DMM(ModeCacheMixin, VisaResource):
     """
     Fluke_DMM(address, factor=1)
 
@@ -18,18 +16,19 @@ class Fluke_DMM(VisaResource):
     shunt. This factor defaults to 1 (no effect on measurement).
     """
 
+    _VALID_MODES_DISPLAY = ("AAC", "ADC", "VAC", "VDC", "OHMS", "FREQ", "CONT")
+    valid_modes = frozenset(_VALID_MODES_DISPLAY)
+    _mode_query = "FUNC1?"
+
+    # setting -> command, built once rather than formatted on every call
+    _RANGE_COMMANDS = {n: f"RANGE {n}" for n in range(1, 8)}
+    _RATE_COMMANDS = {rate: f"RATE {rate}" for rate in ("S", "M", "F")}
+    _MODE_COMMANDS = {mode: f"FUNC1 {mode}" for mode in _VALID_MODES_DISPLAY}
+
     def __init__(self, address: str, **kwargs) -> None:
         super().__init__(address, **kwargs)
         self.factor: float = kwargs.get("factor", 1.0)
-        self.valid_modes: Set[str] = {
-            "AAC",
-            "ADC",
-            "VAC",
-            "VDC",
-            "OHMS",
-            "FREQ",
-            "CONT",
-        }
+        self.invalidate_cache()  # no mode known yet
 
     def _measure_signal(self) -> float:
         """
@@ -64,8 +63,9 @@ class Fluke_DMM(VisaResource):
         if auto_range:
             self.write_resource("AUTO")
 
-        if 0 <= n < 7:
-            self.write_resource(f"RANGE {n}")
+        command = self._RANGE_COMMANDS.get(n)
+        if command is not None:
+            self.write_resource(command)
         else:
             raise ValueError("Invalid range option, should be 1-7")
 
@@ -94,9 +94,9 @@ class Fluke_DMM(VisaResource):
         adjusts the sampling rate for multimeter measurements
         """
 
-        rate = rate.upper()
-        if rate in {"S", "M", "F"}:
-            self.write_resource(f"RATE {rate}")
+        command = self._RATE_COMMANDS.get(rate.upper())
+        if command is not None:
+            self.write_resource(command)
         else:
             raise ValueError("Invalid rate option, should be 'S', 'M', or 'F'")
 
@@ -124,27 +124,17 @@ class Fluke_DMM(VisaResource):
         Configures the multimeter to perform the specified measurement
         """
 
-        mode = mode.upper()
+        if mode not in self.valid_modes:  # only convert case if needed
+            mode = mode.upper()
         if mode in self.valid_modes:
-            self.write_resource.write(f"FUNC1 {mode}")
+            self.write_resource(self._MODE_COMMANDS[mode])
+            self._mode = mode
         else:
             raise ValueError(
-                "Invalid mode option, valid options are: " + ", ".join(self.valid_modes)
+                "Invalid mode option, valid options are: "
+                + ", ".join(self._VALID_MODES_DISPLAY)
             )
 
-    def get_mode(self) -> str:
-        """
-        get_mode()
-
-        retrives type of measurement the multimeter is current configured to
-        perform.
-
-        returns: str
-        """
-
-        response = self.query_resource("FUNC1?")
-        return response
-
     def measure_voltage(self) -> float:
         """
         measure_voltage()
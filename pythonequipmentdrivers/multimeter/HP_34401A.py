@@ -1,10 +1,15 @@
-from time import sleep
-from typing import Any, List, Union
+from concurrent.futures import Future
+from contextlib import contextmanager
+from time import monotonic
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from ..core import VisaResource
+import numpy as np
 
+from ..core import ModeCacheMixin, VisaResource
 
-class HP_34401A(VisaResource):
+
+class HP_34401A(ModeCacheMixin, VisaResource):
     """
     HP_34401A()
 
@@ -12,6 +17,10 @@ class HP_34401A(VisaResource):
 
     factor: float, multiplicitive scale for all measurements defaults to 1.
 
+    raw_socket: bool, if True a LAN (TCPIP) address is opened as a raw socket
+        session on socket_port instead of VXI-11/HiSLIP, avoiding the RPC
+        framing overhead on every command. Defaults to False.
+
     object for accessing basic functionallity of the HP_34401A multimeter.
     The factor term allows for measurements to be multiplied by some number
     before being returned. For example, in the case of measuring the voltage
@@ -22,47 +31,79 @@ class HP_34401A(VisaResource):
     http://ecee.colorado.edu/~mathys/ecen1400/pdf/references/HP34401A_BenchtopMultimeter.pdf
     """
 
-    valid_modes = {
-        "VDC": "VOLT:DC",
-        "VOLT": "VOLT",
-        "VAC": "VOLT:AC",
-        "ADC": "CURR:DC",
-        "AAC": "CURR:AC",
-        "CURR": "CURR",
-        "V": "VOLT",
-        "A": "CURR",
-        "FREQ": "FREQ",
-        "F": "FREQ",
-        "OHMS": "RES",
-        "O": "RES",
-        "RES": "RES",
-        "FRES": "FRES",
-        "DIOD": "DIOD",
-        "D": "DIOD",
-        "CONT": "CONT",
-        "PER": "PER",
-        "P": "PER",
-    }
-
-    valid_ranges = {"AUTO", "MIN", "MAX", "DEF", "0.1", "1", "10", "100", "300"}
-
-    valid_cranges = {"AUTO", "MIN", "MAX", "DEF", "0.01", "0.1", "1", "3"}
-
-    valid_Rranges = {
-        "AUTO",
-        "MIN",
-        "MAX",
-        "DEF",
-        "100",
-        "1E3",
-        "10E3",
-        "100E3",
-        "1E6",
-        "10E6",
-        "100E6",
-    }
-
-    nplc = {"0.02", "0.2", "1", "2", "10", "20", "100", "200", "MIN", "MAX"}
+    # whether the meter accepts multiple ";"-separated commands on one line
+    supports_command_batching = True
+
+    socket_port = 5025  # SCPI raw socket port, used with raw_socket=True
+
+    _mode_query = "FUNC?"
+
+    # if set, trigger(wait=True) polls the status byte at this interval (s)
+    # instead of blocking on *OPC?, for firmware where *OPC? can't be used
+    opc_poll_interval: Optional[float] = None
+
+    # time (s) for which display settings read from the meter are reused, they
+    # can also be changed from the front panel so aren't cached indefinitely
+    display_cache_ttl = 0.5
+
+    valid_modes = MappingProxyType(
+        {
+            "VDC": "VOLT:DC",
+            "VOLT": "VOLT",
+            "VAC": "VOLT:AC",
+            "ADC": "CURR:DC",
+            "AAC": "CURR:AC",
+            "CURR": "CURR",
+            "V": "VOLT",
+            "A": "CURR",
+            "FREQ": "FREQ",
+            "F": "FREQ",
+            "OHMS": "RES",
+            "O": "RES",
+            "RES": "RES",
+            "FRES": "FRES",
+            "DIOD": "DIOD",
+            "D": "DIOD",
+            "CONT": "CONT",
+            "PER": "PER",
+            "P": "PER",
+            # SCPI forms map to themselves so values fed back in (e.g. from
+            # get_mode) resolve in a single lookup
+            "VOLT:DC": "VOLT:DC",
+            "VOLT:AC": "VOLT:AC",
+            "CURR:DC": "CURR:DC",
+            "CURR:AC": "CURR:AC",
+        }
+    )
+
+    valid_ranges = frozenset(
+        ("AUTO", "MIN", "MAX", "DEF", "0.1", "1", "10", "100", "300")
+    )
+
+    valid_cranges = frozenset(("AUTO", "MIN", "MAX", "DEF", "0.01", "0.1", "1", "3"))
+
+    valid_Rranges = frozenset(
+        (
+            "AUTO",
+            "MIN",
+            "MAX",
+            "DEF",
+            "100",
+            "1E3",
+            "10E3",
+            "100E3",
+            "1E6",
+            "10E6",
+            "100E6",
+        )
+    )
+
+    # functions which integrate over a number of power line cycles
+    _NPLC_FUNCTIONS = frozenset(("VOLT:DC", "CURR:DC", "RES", "FRES"))
+
+    _NPLC_VALUES = MappingProxyType({"MIN": 0.02, "MAX": 100.0})
+
+    nplc = frozenset(("0.02", "0.2", "1", "2", "10", "20", "100", "200", "MIN", "MAX"))
 
     valid_resolutions = {
         "0.02": 0.0001,  # lookup based on nplc
@@ -77,29 +118,54 @@ class HP_34401A(VisaResource):
         "MAX": 0.00000022,
     }
 
-    valid_trigger = {
-        "BUS": "BUS",
-        "IMMEDIATE": "IMMediate",
-        "IMM": "IMMediate",
-        "EXTERNAL": "EXTernal",
-        "EXT": "EXTernal",
-        "ALARM1": "ALARm1",
-        "ALARM2": "ALARm2",
-        "ALARM3": "ALARm3",
-        "ALARM4": "ALARm4",
-        "TIMER": "TIMer",
-        "TIME": "TIMer",
-        "TIM": "TIMer",
-    }
+    valid_trigger = MappingProxyType(
+        {
+            "BUS": "BUS",
+            "IMMEDIATE": "IMMediate",
+            "IMM": "IMMediate",
+            "EXTERNAL": "EXTernal",
+            "EXT": "EXTernal",
+            "ALARM1": "ALARm1",
+            "ALARM2": "ALARm2",
+            "ALARM3": "ALARm3",
+            "ALARM4": "ALARm4",
+            "TIMER": "TIMer",
+            "TIME": "TIMer",
+            "TIM": "TIMer",
+            # SCPI forms map to themselves so values fed back in (e.g. from
+            # get_trigger_source) resolve in a single lookup
+            "IMMediate": "IMMediate",
+            "EXTernal": "EXTernal",
+            "ALARm1": "ALARm1",
+            "ALARm2": "ALARm2",
+            "ALARm3": "ALARm3",
+            "ALARm4": "ALARm4",
+            "TIMer": "TIMer",
+        }
+    )
 
     def __init__(self, address: str, **kwargs) -> None:
+        if kwargs.get("raw_socket", False):
+            address = self._socket_address(address)
+        if address.upper().endswith("::SOCKET"):
+            # raw sockets have no message framing, responses end with a newline
+            kwargs.setdefault("read_termination", "\n")
+            kwargs.setdefault("write_termination", "\n")
         super().__init__(address, **kwargs)
+        self.invalidate_cache()  # no mode known yet
         self.factor = kwargs.get("factor", 1.0)
         self.nplc_default = 1  # power line cycles to average
         self.line_frequency = kwargs.get("line_frequency", float(50))  # Hz
-        self.sample_count = self.get_sample_count()
-        self.measure_time = self.set_measure_time()
-        self.trigger_mode = self.get_trigger_source()
+
+    @classmethod
+    def _socket_address(cls, address: str) -> str:
+        # "TCPIP0::<host>::inst0::INSTR" -> "TCPIP0::<host>::5025::SOCKET",
+        # addresses for other interfaces are returned unchanged
+        board, _, rest = address.partition("::")
+        if not board.upper().startswith("TCPIP") or rest.upper().endswith("::SOCKET"):
+            return address
+        host = rest.split("::")[0]
+        return f"{board}::{host}::{cls.socket_port}::SOCKET"
 
     def __del__(self) -> None:
         self.set_local()
@@ -119,24 +185,143 @@ class HP_34401A(VisaResource):
         Configures the multimeter to perform the specified measurement
         """
 
-        mode = str(mode).upper()
-        if not (mode in self.valid_modes):
-            raise ValueError("Invalid mode option")
-
-        self.write_resource(f"CONF:{self.valid_modes[mode]}")
-
-    def get_mode(self) -> str:
-        """
-        get_mode()
-
-        retrives type of measurement the multimeter is current configured to
-        perform.
-
-        returns: str
-        """
-
-        response = self.query_resource("FUNC?")
-        return response.replace('"', "")
+        function = self._validate_mode(mode)
+        self.write_resource(f"CONF:{function}")
+        self._configured(self._function_name(function))
+
+    def _validate_mode(self, mode: str) -> str:
+        # returns the SCPI function for a mode, the option names are already
+        # upper case so only convert the case if there's no direct match
+        function = self.valid_modes.get(mode)
+        if function is None:
+            function = self.valid_modes.get(str(mode).upper())
+            if function is None:
+                raise ValueError("Invalid mode option")
+        return function
+
+    def _validate_trigger(self, trigger: str) -> str:
+        # returns the SCPI trigger source for a trigger option
+        source = self.valid_trigger.get(trigger)
+        if source is None:
+            source = self.valid_trigger.get(str(trigger).upper())
+            if source is None:
+                raise ValueError("Invalid trigger option")
+        return source
+
+    def invalidate_cache(self) -> None:
+        """
+        invalidate_cache()
+
+        Clears the cached mode, sample/trigger counts, trigger source, NPLC and
+        display settings.
+        """
+
+        super().invalidate_cache()
+        self._sample_count = None
+        self._trigger_count = None
+        self._trigger_mode = None
+        self._nplc = None
+        self._display_cache: Dict[str, Tuple[float, Any]] = {}
+
+    def _cached_query(self, query: str, parse: Callable, refresh: bool) -> Any:
+        # returns the parsed response to a display query, re-querying the
+        # meter once the cached value is older than display_cache_ttl
+        stamp, value = self._display_cache.get(query, (None, None))
+        if refresh or (stamp is None) or (monotonic() - stamp > self.display_cache_ttl):
+            value = parse(self.query_resource(query))
+            self._display_cache[query] = (monotonic(), value)
+        return value
+
+    def _cache_setting(self, query: str, value: Any) -> None:
+        # records a value just written, as read back by query
+        self._display_cache[query] = (monotonic(), value)
+
+    # the sample count, trigger count and trigger source are read from the
+    # meter when first needed, assigning them only updates the cached value
+    _measure_time: Optional[float] = None  # set by set_measure_time
+
+    @property
+    def sample_count(self) -> int:
+        return self.get_sample_count()
+
+    @sample_count.setter
+    def sample_count(self, count: int) -> None:
+        self._sample_count = count
+        self._measure_time = None
+
+    @property
+    def trigger_count(self) -> int:
+        return self.get_trigger_count()
+
+    @trigger_count.setter
+    def trigger_count(self, count: int) -> None:
+        self._trigger_count = count
+
+    @property
+    def trigger_mode(self) -> str:
+        return self.get_trigger_source()
+
+    @trigger_mode.setter
+    def trigger_mode(self, source: str) -> None:
+        self._trigger_mode = source
+
+    @property
+    def measure_time(self) -> float:
+        """
+        Time (s) a measurement is expected to take, used to size timeouts.
+        Unless set (see set_measure_time) it's estimated from the sample count
+        and integration time.
+        """
+
+        if self._measure_time is not None:
+            return self._measure_time
+        return (
+            self.get_sample_count()
+            * (self._nplc or self.nplc_default)
+            * (1 / self.line_frequency)
+            + 0.01
+        )
+
+    @measure_time.setter
+    def measure_time(self, measure_time: Optional[float]) -> None:
+        self._measure_time = measure_time
+
+    def refresh(self) -> None:
+        """
+        refresh()
+
+        Re-reads the measurement mode, sample count, trigger count and trigger
+        source from the meter in a single query (when supports_command_batching
+        is set), updating the cached values. These are otherwise read from the
+        meter the first time they're needed.
+        """
+
+        queries = ("FUNC?", "SAMP:COUN?", "TRIG:COUN?", "TRIG:SOUR?")
+        if self.supports_command_batching:
+            responses = self.query_resource(";:".join(queries)).split(";")
+        else:
+            responses = [self.query_resource(query) for query in queries]
+
+        mode, sample_count, trigger_count, trigger_source = responses
+        self._mode = mode.strip('"')
+        self._sample_count = int(float(sample_count))
+        self._trigger_count = int(float(trigger_count))
+        self._trigger_mode = self.valid_trigger[trigger_source.strip()]
+
+    def _configured(self, mode: str) -> None:
+        # CONF and MEAS? set the function and preset the sample count, trigger
+        # count and trigger source, keep the cache in step with the meter
+        self._mode = mode
+        self._sample_count = 1
+        self._trigger_count = 1
+        self._trigger_mode = self.valid_trigger["IMMEDIATE"]
+        self._nplc = None  # default integration time, see set_measure_time
+        self._measure_time = None  # estimated for the new settings
+
+    @staticmethod
+    def _function_name(conf_function: str) -> str:
+        # FUNC? reports DC functions without the ":DC" suffix used by CONF
+        return conf_function.replace(":DC", "")
 
     def get_error(self, **kwargs) -> str:
         """
@@ -165,8 +350,8 @@ class HP_34401A(VisaResource):
         """
 
         valid_delay = {"MIN", "MINIMUM", "MAX", "MAXIMUM"}
-        valid_count = {"MIN", "MINIMUM", "MAX", "MAXIMUM", "INF", "INFINITE"}
 
+        cmds = []
         if kwargs.get("delay", False):
 
             if isinstance(kwargs["delay"], str):
@@ -177,30 +362,22 @@ class HP_34401A(VisaResource):
             if not ((delay in valid_delay) or isinstance(delay, (int, float))):
                 raise ValueError(f"Invalid trigger delay. Use: {valid_delay}")
 
-            self.write_resource(f"TRIG:DELay {delay}")
+            cmds.append(f"TRIG:DELay {delay}")
 
         if kwargs.get("count", False):
+            count = self._validate_trigger_count(kwargs["count"])
+            cmds.append(f"TRIG:COUNt {count}")
 
-            if isinstance(kwargs["count"], str):
-                count = kwargs["count"].upper()
-            else:
-                count = kwargs["count"]
-
-            if not ((count in valid_count) or isinstance(count, int)):
-                # note: if count is not an int the 2nd condition wont execute
-                if not (isinstance(count, int) and (1 <= count <= 50000)):
-                    raise ValueError(
-                        "Invalid trigger count."
-                        f" Use: {valid_count} or an int within"
-                        " the range [1, 50000]"
-                    )
+        source = self._validate_trigger(trigger)
+        cmds.append(f"TRIG:SOUR {source}")
 
-            self.write_resource(f"TRIG:COUNt {count}")
+        with self.batch():  # sent as a single message where supported
+            for cmd_str in cmds:
+                self.write_resource(cmd_str)
 
-        trigger = trigger.upper()
-        if trigger not in self.valid_trigger:
-            raise ValueError("Invalid trigger option")
-        self.write_resource(f"TRIG:{self.valid_trigger[trigger]}")
+        self._trigger_mode = source
+        if kwargs.get("count", False):
+            self._trigger_count = count if isinstance(count, int) else None
 
     def set_trigger_source(self, trigger: str = "IMMEDIATE", **kwargs) -> None:
         """
@@ -212,20 +389,23 @@ class HP_34401A(VisaResource):
             valid modes are: 'BUS', 'IMMEDIATE', 'EXTERNAL'.
         """
 
-        trigger = str(trigger).upper()
-        if trigger not in self.valid_trigger:
-            raise ValueError("Invalid trigger option")
+        source = self._validate_trigger(trigger)
+        self.write_resource(f"TRIG:SOUR {source}", **kwargs)
+        self._trigger_mode = source
 
-        self.trigger_mode = self.valid_trigger[trigger]
-        self.write_resource(f"TRIG:SOUR {self.trigger_mode}", **kwargs)
-
-    def get_trigger_source(self, **kwargs) -> str:
+    def get_trigger_source(self, refresh: bool = False, **kwargs) -> str:
+        """
+        get_trigger_source(refresh=False)
 
-        response = self.query_resource("TRIG:SOUR?", **kwargs)
-        fmt_resp = self.resp_format(response, str)
+        Returns the trigger source. The value is cached once known, set refresh
+        to re-read it from the meter.
+        """
 
-        self.trigger_mode = self.valid_trigger[fmt_resp]
-        return self.trigger_mode
+        if refresh or (self._trigger_mode is None):
+            response = self.query_resource("TRIG:SOUR?", **kwargs)
+            fmt_resp = self.resp_format(response, str)
+            self._trigger_mode = self.valid_trigger[fmt_resp]
+        return self._trigger_mode
 
     def set_trigger_count(self, count: int, **kwargs) -> None:
         """
@@ -234,30 +414,44 @@ class HP_34401A(VisaResource):
         Args:
             count (int): how many readings to take when triggered
         """
+        count = self._validate_trigger_count(count)
+        self.write_resource(f"TRIG:COUNt {count}", **kwargs)
+        # named settings (MIN, INF, ...) are re-read when next requested
+        self._trigger_count = count if isinstance(count, int) else None
+
+    @staticmethod
+    def _validate_trigger_count(count: Union[int, str]) -> Union[int, str]:
         valid_count = {"MIN", "MINIMUM", "MAX", "MAXIMUM", "INF", "INFINITE"}
 
-        count = count.upper() if isinstance(count, str) else count
+        if isinstance(count, str):
+            count = count.upper()
+            if count in valid_count:
+                return count
+        elif isinstance(count, int) and (1 <= count <= 50000):
+            return count
 
-        if not ((count in valid_count) or isinstance(count, int)):
-            # note: if count is not an int the 2nd condition wont execute
-            if isinstance(count, int) and (1 <= count <= 50000):
-                pass
-            else:
-                raise ValueError(
-                    "Invalid trigger count."
-                    f" Use: {valid_count} or an int within"
-                    " the range [1, 50000]"
-                )
+        raise ValueError(
+            "Invalid trigger count."
+            f" Use: {valid_count} or an int within"
+            " the range [1, 50000]"
+        )
 
-        self.write_resource(f"TRIG:COUNt {count}", **kwargs)
+    def get_trigger_count(self, refresh: bool = False, **kwargs) -> int:
+        """
+        get_trigger_count(refresh=False)
 
-    def get_trigger_count(self, **kwargs) -> int:
-        response = self.query_resource("TRIG:COUN?", **kwargs)
-        return int(self.resp_format(response, float))
+        Returns the trigger count. The value is cached once known, set refresh
+        to re-read it from the meter.
+        """
+
+        if refresh or (self._trigger_count is None):
+            response = self.query_resource("TRIG:COUN?", **kwargs)
+            self._trigger_count = int(self.resp_format(response, float))
+        return self._trigger_count
 
-    def measure_voltage(self):
+    def measure_voltage(self, force: bool = False):
         """
-        measure_voltage()
+        measure_voltage(force=False)
 
         returns float, measurement in Volts DC
 
@@ -266,15 +460,16 @@ class HP_34401A(VisaResource):
         exception. This can be remedied by setting the meaurement mode with the
         set_mode method.
 
+        If force is True the mode isn't checked first, the measurement query
+        configures the meter for the measurement itself.
+
         """
-        if self.get_mode() != "VOLT":
-            raise IOError("Multimeter is not configured to measure voltage")
-        response = self.query_resource("MEAS:VOLT:DC?")
-        return self.factor * float(response)
+        response = self._measure("VOLT", "MEAS:VOLT:DC?", "voltage", force)
+        return self.factor * response
 
-    def measure_voltage_rms(self):
+    def measure_voltage_rms(self, force: bool = False):
         """
-        measure_voltage_rms()
+        measure_voltage_rms(force=False)
 
         returns float, measurement in Volts rms
 
@@ -283,15 +478,16 @@ class HP_34401A(VisaResource):
         exception. This can be remedied by setting the meaurement mode with the
         set_mode method.
 
+        If force is True the mode isn't checked first, the measurement query
+        configures the meter for the measurement itself.
+
         """
-        if self.get_mode() != "VOLT:AC":
-            raise IOError("Multimeter is not configured to measure AC voltage")
-        response = self.query_resource("MEAS:VOLT:AC?")
-        return self.factor * float(response)
+        response = self._measure("VOLT:AC", "MEAS:VOLT:AC?", "AC voltage", force)
+        return self.factor * response
 
-    def measure_current(self):
+    def measure_current(self, force: bool = False):
         """
-        measure_current()
+        measure_current(force=False)
 
         returns float, measurement in Amperes DC
 
@@ -300,15 +496,16 @@ class HP_34401A(VisaResource):
         will raise an exception. This can be remedied by setting the meaurement
         mode with the set_mode method.
 
+        If force is True the mode isn't checked first, the measurement query
+        configures the meter for the measurement itself.
+
         """
-        if self.get_mode() != "CURR":
-            raise IOError("Multimeter is not configured to measure current")
-        response = self.query_resource("MEAS:CURR:DC?")
-        return self.factor * float(response)
+        response = self._measure("CURR", "MEAS:CURR:DC?", "current", force)
+        return self.factor * response
 
-    def measure_current_rms(self):
+    def measure_current_rms(self, force: bool = False):
         """
-        measure_current_rms()
+        measure_current_rms(force=False)
 
         returns float, measurement in Amperes rms
 
@@ -317,15 +514,16 @@ class HP_34401A(VisaResource):
         will raise an exception. This can be remedied by setting the meaurement
         mode with the set_mode method.
 
+        If force is True the mode isn't checked first, the measurement query
+        configures the meter for the measurement itself.
+
         """
-        if self.get_mode() != "CURR:AC":
-            raise IOError("Multimeter is not configured to measure AC current")
-        response = self.query_resource("MEAS:CURR:AC?")
-        return self.factor * float(response)
+        response = self._measure("CURR:AC", "MEAS:CURR:AC?", "AC current", force)
+        return self.factor * response
 
-    def measure_resistance(self):
+    def measure_resistance(self, force: bool = False):
         """
-        measure_resistance()
+        measure_resistance(force=False)
 
         returns float, measurement in Ohms
 
@@ -334,15 +532,16 @@ class HP_34401A(VisaResource):
         exception. This can be remedied by setting the meaurement mode with the
         set_mode method.
 
+        If force is True the mode isn't checked first, the measurement query
+        configures the meter for the measurement itself.
+
         """
-        if self.get_mode() != "RES":
-            raise IOError("Multimeter is not configured to measure resistance")
-        response = self.query_resource("MEAS:RES?")
-        return float(response)
+        response = self._measure("RES", "MEAS:RES?", "resistance", force)
+        return response
 
-    def measure_frequency(self):
+    def measure_frequency(self, force: bool = False):
         """
-        measure_frequency()
+        measure_frequency(force=False)
 
         returns float, measurement in Hertz
 
@@ -351,12 +550,86 @@ class HP_34401A(VisaResource):
         exception. This can be remedied by setting the meaurement mode with the
         set_mode method.
 
+        If force is True the mode isn't checked first, the measurement query
+        configures the meter for the measurement itself.
+
+        """
+        response = self._measure("FREQ", "MEAS:FREQ?", "frequency", force)
+        return response
+
+    def _measure(
+        self, mode: str, command: str, quantity: str, force: bool = False
+    ) -> float:
+        """
+        _measure(mode, command, quantity, force=False)
+
+        Sends the measurement query if the meter is in the given mode,
+        otherwise raises an IOError. The cached mode is checked when known,
+        if not it is read from the meter before anything is sent that could
+        change its configuration. If force is True the measurement query
+        (MEAS?), which configures the meter itself, is sent without any check.
+
+        When the cache shows the meter is already set up for a single
+        immediately triggered reading in this mode (i.e. after set_mode or
+        config) READ? is used instead of MEAS?, which keeps the configured
+        range and resolution rather than resetting them to their defaults.
         """
-        if self.get_mode() != "FREQ":
-            raise IOError("Multimeter is not configured to measure frequency")
-        response = self.query_resource("MEAS:FREQ?")
+
+        if (not force) and (self._mode == mode) and self._single_reading():
+            return float(self.query_resource("READ?"))
+
+        # MEAS? reconfigures the meter, so the mode is checked beforehand
+        if (not force) and (self.get_mode() != mode):
+            raise IOError(f"Multimeter is not configured to measure {quantity}")
+        response = self.query_resource(command)
+
+        self._configured(mode)
         return float(response)
 
+    def _single_reading(self) -> bool:
+        # whether READ? is known to return one immediately triggered reading
+        return (
+            (self._sample_count == 1)
+            and (self._trigger_count == 1)
+            and (self._trigger_mode == self.valid_trigger["IMMEDIATE"])
+        )
+
+    def measure_multiple(self, modes: List[str]) -> List[float]:
+        """
+        measure_multiple(modes)
+
+        Takes one reading of each of the given measurements and returns them
+        in the same order. The MEAS? queries are chained into a single message
+        (when supports_command_batching is set) so e.g. a voltage and a
+        current are read in one round-trip rather than a mode change and a
+        query for each. Each MEAS? configures the meter for its measurement,
+        the meter is left configured for the last one. Voltage and current
+        readings are scaled by factor as with the measure_* methods.
+
+        Args:
+            modes (List[str]): measurements to take, see set_mode for options
+                i.e. ['VDC', 'ADC']
+
+        Returns:
+            List[float]: the readings
+        """
+
+        functions = [self._validate_mode(mode) for mode in modes]
+        if not functions:
+            return []
+        commands = [f"MEAS:{function}?" for function in functions]
+
+        if self.supports_command_batching:
+            responses = self.query_resource(";:".join(commands)).split(";")
+        else:
+            responses = [self.query_resource(command) for command in commands]
+        self._configured(self._function_name(functions[-1]))
+
+        return [
+            float(response) * (self.factor if function[:4] in ("VOLT", "CURR") else 1)
+            for function, response in zip(functions, responses)
+        ]
+
     def init(self, **kwargs) -> None:
         """
         init(**kwargs)
@@ -367,7 +640,27 @@ class HP_34401A(VisaResource):
 
         self.write_resource("INITiate", **kwargs)
 
-    def fetch_data(self, **kwargs) -> float:
+    def _scaled_readings(self, response: str) -> Union[float, List[float]]:
+        readings = self.resp_format(response, float)
+        if isinstance(readings, list):
+            return [n * self.factor for n in readings]
+        return readings * self.factor
+
+    def read(self, **kwargs) -> Union[float, List[float]]:
+        """
+        read(**kwargs)
+
+        Initiates a measurement in the current configuration and returns the
+        readings once complete (READ?), without reconfiguring the meter as the
+        MEAS? queries do. The trigger source should be IMMediate.
+
+        Returns:
+            [list, float]: scaled reading(s)
+        """
+        response = self.query_resource("READ?", **kwargs)
+        return self._scaled_readings(response)
+
+    def fetch_data(self, **kwargs) -> Union[float, List[float]]:
         """
         fetch_data(**kwargs)
 
@@ -375,10 +668,64 @@ class HP_34401A(VisaResource):
             [list, float]: data in meter memory resulting from all scans
         """
         response = self.query_resource("FETC?", **kwargs)
-        formatted_response = self.resp_format(response, float)
-        if isinstance(formatted_response, list):
-            return [n * self.factor for n in formatted_response]
-        return formatted_response * self.factor
+        return self._scaled_readings(response)
+
+    def measure_batch(self, n: int, mode: Optional[str] = None) -> np.ndarray:
+        """
+        measure_batch(n, mode=None)
+
+        Takes n readings using the meter's internal sample buffer and returns
+        them together, rather than paying a round-trip per reading. The sample
+        count is set to n, a measurement is initiated and once it completes
+        (*OPC?) all of the readings are fetched in a single transfer. The
+        trigger source should be IMMediate. The sample count is left at n.
+
+        Args:
+            n (int): number of readings to take, 1 to 50000
+            mode (str, optional): if given the meter is first configured for
+                this measurement (see set_mode), otherwise the current
+                configuration is used. Defaults to None.
+
+        Returns:
+            np.ndarray: the n scaled readings
+        """
+
+        if mode is not None:
+            self.set_mode(mode)
+        if self.get_sample_count() != n:
+            self.set_sample_count(n)
+
+        self.init()
+        # returns as soon as the readings are complete, measure_time is only
+        # used to make sure long acquisitions don't time out
+        self.wait_complete(timeout=max(2 * self.measure_time, self.timeout / 1000))
+        return np.atleast_1d(self.fetch_data())
+
+    def stream(self, n: int) -> Iterator[Union[float, List[float]]]:
+        """
+        stream(n)
+
+        Yields n readings, each taken with READ? (initiate and fetch) in the
+        current configuration. The next reading is requested in the
+        background (see query_resource_async) before the current one is
+        yielded, so the meter is acquiring while the caller processes the
+        previous reading rather than idling between queries. If the sample
+        count is greater than 1 each reading is a list of the samples.
+
+        Args:
+            n (int): number of readings to take
+
+        Yields:
+            [list, float]: scaled reading(s)
+        """
+
+        pending = self.query_resource_async("READ?") if n > 0 else None
+        for i in range(n):
+            response = pending.result()
+            if i + 1 < n:
+                pending = self.query_resource_async("READ?")
+
+            yield self._scaled_readings(response)
 
     def abort(self, **kwargs) -> None:
         """
@@ -397,34 +744,78 @@ class HP_34401A(VisaResource):
 
         Args:
             wait (bool, optional): Does not return to caller until scantime
-                                   is complete.  Prevents Trigger Ignored
-                                   errors (-211). Defaults to True.
+                                   is complete (the meter answers *OPC?).
+                                   Prevents Trigger Ignored errors (-211).
+                                   Defaults to True.
         Returns:
             None
         """
 
-        if self.trigger_mode == self.valid_trigger["BUS"]:
+        if self.get_trigger_source() == self.valid_trigger["BUS"]:
             self.write_resource("*TRG", **kwargs)
         else:
             print(
-                f"Trigger not configured, set as: {self.trigger_mode}"
+                f"Trigger not configured, set as: {self._trigger_mode}"
                 f" should be {self.valid_trigger['BUS']}"
             )
 
         if wait:
-            sleep(self.measure_time)  # should work most of the time.
-            # it should also wait nplc time per channel
-            # need to make a function to track nplc time
-            # if nplc is longer than 1, then this will fail, if shorter
-            # then this will take way too long
+            # returns as soon as the measurement completes, measure_time is
+            # only used to make sure long measurements don't time out
+            timeout = max(2 * self.measure_time, self.timeout / 1000)
+            if self.opc_poll_interval is None:
+                self.wait_complete(timeout=timeout)
+            else:
+                self.poll_complete(timeout=timeout, interval=self.opc_poll_interval)
+
+    def trigger_async(self, **kwargs) -> Future:
+        """
+        trigger_async(**kwargs)
+
+        Performs trigger(wait=True) in the resource's background worker (see
+        query_resource_async) and returns immediately, the future resolves
+        once the measurement is complete. Waiting on the measurement then
+        doesn't hold up the calling thread, so several meters can be
+        triggered and measure concurrently. For use with asyncio the returned
+        future can be wrapped with asyncio.wrap_future.
+
+        Returns:
+            Future: resolves to None once the triggered measurement completes
+        """
+
+        return self._submit(self.trigger, wait=True, **kwargs)
+
+    def fetch_data_async(self, **kwargs) -> Future:
+        """
+        fetch_data_async(**kwargs)
+
+        Performs fetch_data in the resource's background worker and returns
+        immediately. As the worker handles requests in order, a fetch
+        submitted after trigger_async returns the readings of that trigger.
+
+        Returns:
+            Future: resolves to the value returned by fetch_data
+        """
+
+        return self._submit(self.fetch_data, **kwargs)
 
     def set_sample_count(self, count: int, **kwargs) -> None:
         self.write_resource(f"SAMP:COUN {count}", **kwargs)
+        self._sample_count = count if isinstance(count, int) else None
+        self._measure_time = None
+
+    def get_sample_count(self, refresh: bool = False, **kwargs) -> int:
+        """
+        get_sample_count(refresh=False)
+
+        Returns the number of samples taken per trigger. The value is cached
+        once known, set refresh to re-read it from the meter.
+        """
 
-    def get_sample_count(self, **kwargs) -> int:
-        response = self.query_resource("SAMP:COUN?", **kwargs)
-        self.sample_count = int(self.resp_format(response, float))
-        return self.sample_count
+        if refresh or (self._sample_count is None):
+            response = self.query_resource("SAMP:COUN?", **kwargs)
+            self._sample_count = int(self.resp_format(response, float))
+        return self._sample_count
 
     def config(
         self,
@@ -454,65 +845,54 @@ class HP_34401A(VisaResource):
                 purposes. Defaults to False.
         """
 
-        valid_acdc = {"DC": ":DC", "AC": ":AC"}
-
-        mode = mode.upper()
-        if mode not in self.valid_modes:
-            raise ValueError("Invalid mode option")
-        mode = self.valid_modes[mode]
+        function, _, coupling = self._validate_mode(mode).partition(":")
+        base_function = function
 
-        usefreq = mode == self.valid_modes["FREQ"]
-        usecurrent = mode == self.valid_modes["CURR"]
-        useres = mode == self.valid_modes["RES"]
+        if function in ("VOLT", "CURR"):  # the only functions with coupling
+            acdc = coupling or str(acdc).upper()
+            if acdc not in ("DC", "AC"):
+                raise ValueError("Invalid acdc option")
+            function = f"{function}:{acdc}"
 
-        acdc = acdc.upper()
-        if acdc not in valid_acdc:
-            raise ValueError("Invalid acdc option")
-        acdc = valid_acdc[acdc] if not usefreq else ""
+        range_options = {
+            "CURR": self.valid_cranges,
+            "RES": self.valid_Rranges,
+            "FRES": self.valid_Rranges,
+        }.get(base_function, self.valid_ranges)
 
         # if range is not provided, cannot use nplc in CONF command
-        signal_range = signal_range.upper()
+        signal_range = str(signal_range).upper()
         if signal_range == "AUTO":
-            signal_range = False
-
-        try:
-            if usecurrent and signal_range not in self.valid_cranges:
-                raise ValueError("Invalid Current Range option")
-            elif useres and signal_range not in self.valid_Rranges:
-                raise ValueError("Invalid Resistance Range option")
-            elif signal_range not in self.valid_ranges:
-                raise ValueError("Invalid Range option")
-
-        except ValueError:
+            signal_range = None
+        elif signal_range not in range_options:
             if kwargs.get("verbose", False):
                 print("signal_range not in list, using max")
-            signal_range = "MAX"  # same as MAX for current
+            signal_range = "MAX"
 
         nplc = str(nplc).upper()
-        if not (nplc in self.nplc):
+        if nplc not in self.nplc:
             raise ValueError("Invalid nplc option")
-        nplc = nplc if not usefreq else ""
 
-        cmds = []
-        if resolution and signal_range:
-            cmds.append(f"CONF:{mode}{acdc} {signal_range},{resolution}")
+        conf = f"CONF:{function}"
+        if signal_range and resolution:
+            cmds = [f"{conf} {signal_range},{resolution}"]
         else:
-            if signal_range:
-                cmds.append(f"CONF:{mode}{acdc} {signal_range}")
-            else:
-                cmds.append(f"CONF:{mode}{acdc}")
-
-            if (resolution or nplc) and (not usefreq):
-                cmds.append(
-                    f"SENS:{mode}{acdc}"
-                    f"{':RES ' if resolution else ':NPLC '}"
-                    f"{resolution if resolution else nplc}"
-                )
-
-        for cmd_str in cmds:
-            if kwargs.get("verbose", False):
-                print(cmd_str)
-            self.write_resource(cmd_str, **kwargs)
+            cmds = [f"{conf} {signal_range}" if signal_range else conf]
+            # FREQ/PER use a gate time rather than resolution/integration time
+            if resolution and base_function not in ("FREQ", "PER"):
+                cmds.append(f"SENS:{function}:RES {resolution}")
+            elif function in self._NPLC_FUNCTIONS:
+                cmds.append(f"SENS:{function}:NPLC {nplc}")
+
+        verbose = kwargs.pop("verbose", False)  # the rest are for the write
+        with self.batch():  # sent as a single message where supported
+            for cmd_str in cmds:
+                if verbose:
+                    print(cmd_str)
+                self.write_resource(cmd_str, **kwargs)
+        self._configured(self._function_name(function))
+        if cmds[-1].startswith(f"SENS:{function}:NPLC"):
+            self._nplc = self._NPLC_VALUES.get(nplc) or float(nplc)
 
     def resp_format(
         self, response: str, resp_type: type = int
@@ -526,31 +906,67 @@ class HP_34401A(VisaResource):
 
         Returns:
             list[type], or type: return is a list if more than 1 element
-                                 otherwise returns the single element as type
+                                 otherwise returns the single element as type.
         """
-        if "@" in response:
-            start = response.find("@")  # note this returns -1 if not found
-            stop = -1
+        # a channel list prefix ends at "@" and is followed by a closing
+        # bracket, otherwise the whole response is data (find returns -1)
+        start = response.find("@")
+        data = response[start + 1 : -1] if start != -1 else response
+
+        if resp_type is float:
+            # converted by numpy in one call, raises ValueError if malformed
+            response = np.array(data.split(","), dtype=float).tolist()
         else:
-            start = -1
-            stop = None
-        # that works out OK because data needs to be parsed from the first
-        # character anyway, so this is not an error, but I don't like
-        # that it isn't explicitly trying to find the correct character
-        response = list(map(resp_type, response[start + 1 : stop].split(",")))
+            response = list(map(resp_type, data.split(",")))
 
         if len(response) == 1:
             return response[0]
         return response
 
     def set_measure_time(self, measure_time: float = None):
-        if measure_time is None:
-            self.measure_time = (
-                self.sample_count * self.nplc_default * (1 / self.line_frequency) + 0.01
-            )
-        else:
-            self.measure_time = measure_time
+        # if measure_time is None it's estimated from the current settings
+        self.measure_time = measure_time
         return self.measure_time
 
+    def set_display_state(self, state: bool) -> None:
+        if state:
+            self.write_resource("DISP ON")
+        else:
+            self.write_resource("DISP OFF")
+        self._cache_setting("DISP?", bool(state))
+
+    def get_display_state(self, refresh: bool = False) -> bool:
+        return self._cached_query("DISP?", lambda r: bool(int(r)), refresh)
+
+    @contextmanager
+    def fast_mode(self, autozero: bool = True) -> Iterator[None]:
+        """
+        fast_mode(autozero=True)
+
+        Context manager which turns the front panel display off for the
+        duration of the block, updating the display slows down the rate at
+        which readings are taken and transferred. If autozero is False the
+        autozero function (ZERO:AUTO) is also turned off, roughly doubling the
+        reading rate at the cost of offset accuracy. The prior settings are
+        restored when the block exits.
+
+        Args:
+            autozero (bool, optional): whether to leave autozero as it is.
+                Defaults to True.
+        """
+
+        display = self.get_display_state()
+        zero = None if autozero else self.query_resource("ZERO:AUTO?")
+
+        self.set_display_state(False)
+        if zero is not None:
+            self.write_resource("ZERO:AUTO OFF")
+        try:
+            yield
+        finally:
+            if zero is not None:
+                self.write_resource(f"ZERO:AUTO {zero}")
+            self.set_display_state(display)
+
     def set_local(self, **kwargs) -> None:
         self.write_resource("SYSTem:LOCal", **kwargs)
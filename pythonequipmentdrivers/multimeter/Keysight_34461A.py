@@ -1,3 +1,7 @@
+from typing import List, Union
+
+import numpy as np
+
 from .HP_34401A import HP_34401A
 
 # TODO: Add in additional measurement functionallity not written in the
@@ -23,55 +27,93 @@ class Keysight_34461A(HP_34401A):
     https://literature.cdn.keysight.com/litweb/pdf/34460-90901.pdf
     """
 
-    valid_ranges = {"AUTO", "MIN", "MAX", "DEF", "0.1", "1", "10", "100", "1000"}
-
-    valid_cranges = {
-        "AUTO",
-        "MIN",
-        "MAX",
-        "DEF",
-        "0.0001",
-        "0.001",
-        "0.01",
-        "0.1",
-        "1",
-        "3",
-    }
-
-    valid_Rranges = {
-        "AUTO",
-        "MIN",
-        "MAX",
-        "DEF",
-        "100",
-        "1E3",
-        "10E3",
-        "100E3",
-        "1E6",
-        "10E6",
-        "100E6",
-    }
+    valid_ranges = frozenset(
+        ("AUTO", "MIN", "MAX", "DEF", "0.1", "1", "10", "100", "1000")
+    )
+
+    valid_cranges = frozenset(
+        (
+            "AUTO",
+            "MIN",
+            "MAX",
+            "DEF",
+            "0.0001",
+            "0.001",
+            "0.01",
+            "0.1",
+            "1",
+            "3",
+        )
+    )
+
+    valid_Rranges = frozenset(
+        (
+            "AUTO",
+            "MIN",
+            "MAX",
+            "DEF",
+            "100",
+            "1E3",
+            "10E3",
+            "100E3",
+            "1E6",
+            "10E6",
+            "100E6",
+        )
+    )
+
+    _binary_format = False  # transfer fetched readings as binary blocks
+
+    def set_binary_format(self, state: bool = True) -> None:
+        """
+        set_binary_format(state=True)
+
+        Enables (or disables) transferring the readings returned by fetch_data
+        as a binary block of 64-bit floats rather than comma-separated ascii
+        text, 8 bytes per reading rather than ~16 and no text parsing. The
+        meter is only switched to the binary format for the duration of each
+        fetch, other queries are unaffected.
+
+        Args:
+            state (bool, optional): whether to use binary transfers. Defaults
+                to True.
+        """
+
+        if state:
+            self.write_resource("FORM:BORD SWAP")  # little-endian
+        self._binary_format = bool(state)
+
+    def fetch_data(self, **kwargs) -> Union[float, List[float]]:
+        """
+        fetch_data(**kwargs)
+
+        Returns:
+            [list, float]: data in meter memory resulting from all scans
+        """
+
+        if not self._binary_format:
+            return super().fetch_data(**kwargs)
+
+        values = self.query_resource_binary_values(
+            "FORM REAL,64;:FETC?;:FORM ASC",
+            datatype="d",
+            is_big_endian=False,
+            container=np.ndarray,
+            **kwargs,
+        )
+        values = values * self.factor
+        return values.item() if values.size == 1 else values.tolist()
 
     def set_display_text(self, text: str) -> None:
         self.write_resource(f'DISP:TEXT "{text}"')
+        self._cache_setting("DISP:TEXT?", text)
 
-    def get_display_text(self) -> str:
-        response = self.query_resource("DISP:TEXT?")
-        return response.replace('"', "")
+    def get_display_text(self, refresh: bool = False) -> str:
+        return self._cached_query("DISP:TEXT?", lambda r: r.strip('"'), refresh)
 
     def clear_display_text(self) -> None:
         self.set_display_text("")
 
-    def set_display_state(self, state: bool) -> None:
-        if state:
-            self.write_resource("DISP ON")
-        else:
-            self.write_resource("DISP OFF")
-
-    def get_display_state(self) -> bool:
-        response = self.query_resource("DISP?")
-        return bool(int(response))
-
     def set_display_mode(self, mode: str) -> None:
 
         mode = str(mode).upper()
@@ -79,17 +121,52 @@ class Keysight_34461A(HP_34401A):
             raise ValueError(f'Invalid mode for arg "mode" ({mode})')
 
         self.write_resource(f"DISP:VIEW {mode}")
+        self._cache_setting("DISP:VIEW?", mode)
 
-    def get_display_mode(self) -> str:
-        response = self.query_resource("DISP:VIEW?")
-        return response
+    def get_display_mode(self, refresh: bool = False) -> str:
+        return self._cached_query("DISP:VIEW?", str, refresh)
 
     def set_label_text(self, label: str) -> None:
         self.write_resource(f'SYSTEM:LABEL "{label}"')
+        self._cache_setting("SYSTEM:LABEL?", label)
 
-    def get_label_text(self) -> str:
-        response = self.query_resource("SYSTEM:LABEL?")
-        return response.replace('"', "")
+    def get_label_text(self, refresh: bool = False) -> str:
+        return self._cached_query("SYSTEM:LABEL?", lambda r: r.strip('"'), refresh)
 
     def clear_label_text(self) -> None:
         self.set_label_text("")
+
+    def configure_display(
+        self,
+        text: str = None,
+        state: bool = None,
+        mode: str = None,
+        label: str = None,
+    ) -> None:
+        """
+        configure_display(text=None, state=None, mode=None, label=None)
+
+        Updates several of the display settings at once, only the settings
+        which are passed are changed. The commands are sent as a single
+        message (see batch) rather than one write per setting.
+
+        Args:
+            text (str, optional): text to show on the display (see
+                set_display_text). Defaults to None.
+            state (bool, optional): display on/off state (see
+                set_display_state). Defaults to None.
+            mode (str, optional): display view (see set_display_mode).
+                Defaults to None.
+            label (str, optional): instrument label (see set_label_text).
+                Defaults to None.
+        """
+
+        with self.batch():
+            if state is not None:
+                self.set_display_state(state)
+            if mode is not None:
+                self.set_display_mode(mode)
+            if text is not None:
+                self.set_display_text(text)
+            if label is not None:
+                self.set_label_text(label)
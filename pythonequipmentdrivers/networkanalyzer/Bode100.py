@@ -1,7 +1,9 @@
 import importlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import deepcopy
 from dataclasses import dataclass
 from enum import Enum
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 API_LINK = "OmicronLab.VectorNetworkAnalysis.AutomationInterface"
 
@@ -19,12 +21,23 @@ class Bode100:
     """
     Class for interfacing with the Bode100 network analyzer
 
+    Args:
+        early_binding (bool, optional): if True the automation interface is
+            accessed through makepy generated (early-bound) wrappers, which
+            resolve members once rather than on every COM call. Falls back to
+            late binding if the wrappers can't be generated. Defaults to
+            False.
+
     Manufactorers API documentation:
     documentation.omicron-lab.com/BodeAutomationInterface/3.25/index.html
     """
 
-    def __init__(self) -> None:
+    _executor: Optional[ThreadPoolExecutor] = None  # see execute_measurement_async
+    _sweep: Optional[Future] = None  # last sweep submitted to _executor
+
+    def __init__(self, early_binding: bool = False) -> None:
         self._measurement = None
+        self._last_config = None  # config applied to self._measurement
 
         try:
             self.win32com_client = importlib.import_module("win32com.client")
@@ -34,7 +47,7 @@ class Bode100:
             ) from exc
 
         try:
-            self._automation_interface = self.win32com_client.Dispatch(API_LINK)
+            self._automation_interface = self._dispatch(early_binding)
         except self.win32com_client.pywintypes.com_error as error:
             raise ConnectionError(f"Could not load device API: {error}")
 
@@ -47,9 +60,21 @@ class Bode100:
             self._connection = None
             raise ConnectionError("Unable to connect to an availble device", error)
 
-        self.serial_number = self._connection.serialNumber
+        self.serial_number = self._connection.SerialNumber
+
+    def _dispatch(self, early_binding: bool):
+        if early_binding:
+            try:
+                return self.win32com_client.gencache.EnsureDispatch(API_LINK)
+            except (AttributeError, TypeError, ImportError):
+                pass  # no type library available, use late binding
+        return self.win32com_client.Dispatch(API_LINK)
 
     def __del__(self) -> None:
+        if self._executor is not None:
+            if (self._sweep is not None) and not self._sweep.done():
+                self.stop_execution()  # don't block the finalizer on a sweep
+            self._executor.shutdown(wait=False)
         self.clear_measurement()
         self.disconnect()
         self._automation_interface.Dispose()
@@ -114,57 +139,86 @@ class Bode100:
             self._measurement = None
             raise IOError("No connection to a device")
 
-        self._measurement = self._connection.Transmission.CreateGainMeasurement()
+        # an existing measurement is reused, only settings which differ from
+        # the last config applied to it are written (each write is a COM call)
+        previous, self._last_config = self._last_config, None
+        if (self._measurement is None) or (previous is None):
+            self.clear_measurement()
+            self._measurement = self._connection.Transmission.CreateGainMeasurement()
+
+        def changed(*names: str) -> bool:
+            return (previous is None) or any(
+                getattr(config, name) != getattr(previous, name) for name in names
+            )
+
+        # bind locally, each attribute access on a COM object is a lookup
+        measurement = self._measurement
 
         # configure channel 1/2
-        self._measurement.ExternalProbeChannel1 = config.probe_channel1
-        self._measurement.ExternalProbeChannel2 = config.probe_channel2
-        self._measurement.Attenuation.Channel1 = config.attenuation_channel1
-        self._measurement.Attenuation.Channel2 = config.attenuation_channel2
+        if changed("probe_channel1"):
+            measurement.ExternalProbeChannel1 = config.probe_channel1
+        if changed("probe_channel2"):
+            measurement.ExternalProbeChannel2 = config.probe_channel2
+        if changed("attenuation_channel1", "attenuation_channel2"):
+            attenuation = measurement.Attenuation
+            attenuation.Channel1 = config.attenuation_channel1
+            attenuation.Channel2 = config.attenuation_channel2
         #   API Enum value for 50 Ohm = 0, 1 = 1 MOhm
-        self._measurement.TerminationChannel1 = (
-            0 if config.use_50ohm_termination_channel1 else 1
-        )
-        self._measurement.TerminationChannel2 = (
-            0 if config.use_50ohm_termination_channel2 else 1
-        )
+        if changed("use_50ohm_termination_channel1"):
+            measurement.TerminationChannel1 = (
+                0 if config.use_50ohm_termination_channel1 else 1
+            )
+        if changed("use_50ohm_termination_channel2"):
+            measurement.TerminationChannel2 = (
+                0 if config.use_50ohm_termination_channel2 else 1
+            )
 
         # configure reciever
-        self._measurement.ReceiverBandwidth = (
-            config.receiver_bandwidth * 1e3
-        )  # convert from Hz to mHz
-        self._measurement.DutSettlingTime = (
-            config.dut_settling_time * 1e3
-        )  # convert from sec to ms
+        if changed("receiver_bandwidth"):
+            measurement.ReceiverBandwidth = (
+                config.receiver_bandwidth * 1e3
+            )  # convert from Hz to mHz
+        if changed("dut_settling_time"):
+            measurement.DutSettlingTime = (
+                config.dut_settling_time * 1e3
+            )  # convert from sec to ms
 
         # configure signal injection
-        if isinstance(config.source_level, (tuple, list)):  # shaped level
-            shaping_interface = self._measurement.Shaping.SourceShaping
-            shaping_interface.IsEnabled = True
-            shaping_interface.LevelUnit = config.level_unit.value
-
-            shaping_interface.Clear()  # remove any existing settings
-            for freq, level in config.source_level:
-                shaping_interface.Add(freq, level)
-
-        else:  # fixed level
-            self._measurement.SetSourceLevel(
-                config.source_level, config.level_unit.value
+        if changed("source_level", "level_unit"):
+            shaping_interface = measurement.Shaping.SourceShaping
+            if isinstance(config.source_level, (tuple, list)):  # shaped level
+                shaping_interface.IsEnabled = True
+                shaping_interface.LevelUnit = config.level_unit.value
+
+                shaping_interface.Clear()  # remove any existing settings
+                add_point = shaping_interface.Add  # resolve the COM method once
+                for freq, level in config.source_level:
+                    add_point(freq, level)
+
+            else:  # fixed level
+                if previous is not None:  # may have been shaped before
+                    shaping_interface.IsEnabled = False
+                measurement.SetSourceLevel(config.source_level, config.level_unit.value)
+
+        if changed(
+            "start_frequency", "stop_frequency", "number_of_points", "use_log_spacing"
+        ):
+            measurement.ConfigureSweep(
+                config.start_frequency,
+                config.stop_frequency,
+                config.number_of_points,
+                1 if config.use_log_spacing else 0,  # called "SweepMode" in API
             )
-
-        self._measurement.ConfigureSweep(
-            config.start_frequency,
-            config.stop_frequency,
-            config.number_of_points,
-            1 if config.use_log_spacing else 0,  # called "SweepMode" in API
-        )
         #   SweepMode Enum: 0=Linearspacing, 1=LogSpacing, 2=Custom points (not implemented here)
 
+        self._last_config = deepcopy(config)  # copy, config may be modified
+
     def clear_measurement(self) -> None:
         if self._measurement is None:
             return None
         self._measurement.Dispose()
         self._measurement = None
+        self._last_config = None
 
     @property
     def measurement_duration(self) -> float:
@@ -175,20 +229,70 @@ class Bode100:
     def execute_measurement(self) -> None:
         if self._measurement is None:
             raise ValueError("No measurement configured")
+        self._execute(self._measurement)
 
+    def _execute(self, measurement) -> None:
+        # measurement must be usable from the calling thread's COM apartment
         try:
-            status_code = self._measurement.ExecuteMeasurement()
+            status_code = measurement.ExecuteMeasurement()
         except self.win32com_client.pywintypes.com_error as error:
-            self.stop_execution()
+            measurement.StopCurrentExecution()
             raise IOError(error.excepinfo[2])
 
+        if status_code == self._ExecutionState.OK.value:
+            return None
+
         state = self._ExecutionState(status_code)
+        raise Exception(state.name, self._ExecutionStateDescriptions[state.name].value)
+
+    def execute_measurement_async(self) -> Future:
+        """
+        execute_measurement_async()
+
+        Performs execute_measurement in a background worker thread and returns
+        immediately, the future resolves (or raises the same errors) once the
+        sweep is complete. The calling thread is then free to service a UI or
+        other instruments during long sweeps; stop_execution can be called
+        meanwhile to cancel the sweep. Don't reconfigure or read results
+        until the future is done. For use with asyncio the returned future
+        can be wrapped with asyncio.wrap_future.
+
+        The measurement is marshaled to the worker's COM apartment, so if the
+        automation interface is apartment-threaded the calling thread has to
+        keep pumping messages (as a UI event loop does) until the future is
+        done.
+
+        Returns:
+            Future: resolves to None once the measurement is complete
+        """
+
+        if self._measurement is None:
+            raise ValueError("No measurement configured")
 
-        if state != self._ExecutionState.OK:
-            raise Exception(
-                state.name, self._ExecutionStateDescriptions[state.name].value
+        pythoncom = importlib.import_module("pythoncom")
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=self.__class__.__name__,
+                initializer=pythoncom.CoInitialize,  # COM is per-thread
             )
 
+        # COM objects can't be shared between apartments, pass the worker a
+        # stream it can unmarshal its own proxy of the measurement from
+        stream = pythoncom.CoMarshalInterThreadInterfaceInStream(
+            pythoncom.IID_IDispatch, self._measurement._oleobj_
+        )
+        self._sweep = self._executor.submit(self._execute_marshaled, stream)
+        return self._sweep
+
+    def _execute_marshaled(self, stream) -> None:
+        # runs on the executor's worker thread, see execute_measurement_async
+        pythoncom = importlib.import_module("pythoncom")
+        interface = pythoncom.CoGetInterfaceAndReleaseStream(
+            stream, pythoncom.IID_IDispatch
+        )
+        self._execute(self.win32com_client.Dispatch(interface))
+
     def stop_execution(self) -> None:
         if self._measurement is not None:
             self._measurement.StopCurrentExecution()
@@ -214,3 +318,17 @@ class Bode100:
             phase = results.UnwrappedPhase(1 if use_deg else 0)
 
         return (freq, mag, phase)
+
+    def gain_phase_measurement(
+        self,
+        config: GainPhaseConfig,
+        use_db: bool = True,
+        use_deg: bool = True,
+        wrap_phase: bool = True,
+    ) -> GainPhaseResult:
+        # configures, executes and reads back a gain/phase sweep in one call
+        self.configure_gain_phase_measurement(config)
+        self.execute_measurement()
+        return self.read_gain_phase_results(
+            use_db=use_db, use_deg=use_deg, wrap_phase=wrap_phase
+        )
@@ -119,7 +119,7 @@ class Chroma_63206A(VisaResource):  # 6 kW
             raise ValueError('Invalid option for arguement "mode"')
 
         if isinstance(range_setting, int):
-            if range_setting in range(0, 3):
+            if 0 <= range_setting < 3:
                 range_string = valid_ranges[range_setting]
             else:
                 raise ValueError('Invalid option for the int "range_setting"')
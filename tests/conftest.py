@@ -0,0 +1,39 @@
+from typing import Callable, List, Type, TypeVar
+from unittest.mock import MagicMock
+
+import pytest
+
+from pythonequipmentdrivers import VisaResource
+
+Resource = TypeVar("Resource", bound=VisaResource)
+
+
+class MockSession(MagicMock):
+    """
+    Stand-in for the pyvisa session held by a driver (_resource) which records
+    the messages sent to it.
+    """
+
+    def written(self) -> List[str]:
+        return [c.kwargs["message"] for c in self.write.call_args_list]
+
+    def queried(self) -> List[str]:
+        return [c.kwargs["message"] for c in self.query.call_args_list]
+
+
+@pytest.fixture
+def mock_driver() -> Callable[..., VisaResource]:
+    """
+    Returns a factory which creates a driver instance without connecting to an
+    instrument, its session replaced by a MockSession. Keyword arguments are
+    set as attributes of the instance.
+    """
+
+    def build(cls: Type[Resource], **attributes) -> Resource:
+        driver = cls.__new__(cls)
+        driver._resource = MockSession()
+        for name, value in attributes.items():
+            setattr(driver, name, value)
+        return driver
+
+    return build
@@ -1,10 +1,16 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+import pytest
+import pyvisa
+
 import pythonequipmentdrivers as ped
 
 
 class TestFunctions(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def setup_factory(self, mock_driver):
+        self.mock_driver = mock_driver
 
     @patch.object(ped.core.rm, "list_resources")
     def test_find_visa_resources(self, list_resources_patch: MagicMock):
@@ -15,3 +21,129 @@ class TestFunctions(unittest.TestCase):
         )
         list_resources_patch.return_value = return_value
         self.assertEqual(return_value, ped.find_visa_resources())
+
+    def test_query_many_async(self):
+        resources = []
+        for response in ("1", "2", "3"):
+            resource = self.mock_driver(ped.VisaResource)
+            resource._resource.query.return_value = response
+            resources.append(resource)
+
+        queries = [(resource, "VAL?") for resource in resources]
+        self.assertEqual(["1", "2", "3"], ped.query_many_async(queries))
+        for resource in resources:
+            resource._resource.query.assert_called_once_with(message="VAL?")
+
+
+class TestVisaResource(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def setup_driver(self, mock_driver):
+        self.resource = mock_driver(ped.VisaResource)
+        self.resource._resource.timeout = 1000
+        self.written = self.resource._resource.written
+        self.queried = self.resource._resource.queried
+
+    def test_wait_complete(self):
+        self.resource._resource.query.return_value = "1"
+        self.resource.wait_complete(timeout=5)
+        self.resource._resource.query.assert_called_once_with(message="*OPC?")
+        self.assertEqual(1000, self.resource.timeout)
+
+    def test_wait_complete_nonblocking(self):
+        self.resource.wait_complete(block=False)
+        self.resource._resource.write.assert_called_once_with(message="*WAI")
+        self.resource._resource.query.assert_not_called()
+
+    def test_poll_complete(self):
+        self.resource._resource.query.side_effect = ["36", "0", "32", "1"]
+        self.resource.poll_complete(timeout=5, interval=0)
+        self.assertEqual(["*ESE?", "*STB?", "*STB?", "*ESR?"], self.queried())
+        self.assertEqual(["*ESE 1;*OPC", "*ESE 36"], self.written())
+
+    def test_poll_complete_timeout(self):
+        self.resource._resource.query.side_effect = lambda message: (
+            "4" if message == "*ESE?" else "0"
+        )
+        with self.assertRaises(TimeoutError):
+            self.resource.poll_complete(timeout=0.01, interval=0)
+        self.assertEqual(["*ESE 1;*OPC", "*ESE 4"], self.written())
+
+    def test_batch_unsupported(self):
+        with self.resource.batch():
+            self.resource.write_resource("SAMP:COUN 10")
+        self.resource._resource.write.assert_called_once_with(message="SAMP:COUN 10")
+
+    def test_batch(self):
+        self.resource.supports_command_batching = True
+        with self.resource.batch():
+            for n in (10, 100):
+                self.resource.write_resource(f"SAMP:COUN {n}")
+            self.resource.write_resource("*TRG")
+            self.resource.write_resource("SAMP:COUN 5")
+            self.resource._resource.write.assert_not_called()
+        self.resource._resource.write.assert_called_once_with(
+            message="SAMP:COUN 100;:*TRG;:SAMP:COUN 5"
+        )
+
+    def test_batch_flushed_before_query(self):
+        self.resource.supports_command_batching = True
+        with self.resource.batch():
+            self.resource.write_resource("INIT")
+            self.resource.query_resource("FETC?")
+            self.resource._resource.write.assert_called_once_with(message="INIT")
+
+    def test_write_resource_async(self):
+        future = self.resource.write_resource_async("*TRG")
+        self.assertIsNone(future.result())
+        self.resource._resource.write.assert_called_once_with(message="*TRG")
+
+    def test_query_resource_binary_values_error(self):
+        self.resource._resource.query_binary_values.side_effect = pyvisa.VisaIOError(
+            -1073807339
+        )
+        with self.assertRaises(IOError):
+            self.resource.query_resource_binary_values("FETC?", datatype="d")
+
+    def test_enable_fast_tcp(self):
+        self.resource._resource.interface_type = pyvisa.constants.InterfaceType.tcpip
+        self.resource.enable_fast_tcp()
+        self.resource._resource.set_visa_attribute.assert_any_call(
+            pyvisa.constants.VI_ATTR_TCPIP_NODELAY, True
+        )
+
+    def test_enable_fast_tcp_attributes_independent(self):
+        self.resource._resource.interface_type = pyvisa.constants.InterfaceType.tcpip
+        self.resource._resource.set_visa_attribute.side_effect = [
+            pyvisa.VisaIOError(
+                pyvisa.constants.StatusCode.error_nonsupported_attribute
+            ),
+            None,
+        ]
+        self.resource.enable_fast_tcp()
+        self.resource._resource.set_visa_attribute.assert_called_with(
+            pyvisa.constants.VI_ATTR_TCPIP_KEEPALIVE, True
+        )
+
+    @patch.object(ped.core, "_get_resource_manager")
+    def test_fast_tcp_opt_in(self, rm_patch: MagicMock):
+        resource = rm_patch.return_value.open_resource.return_value
+        resource.interface_type = pyvisa.constants.InterfaceType.tcpip
+        ped.VisaResource("TCPIP0::localhost::inst0::INSTR")
+        resource.set_visa_attribute.assert_not_called()
+
+    def test_enable_fast_tcp_other_interface(self):
+        self.resource._resource.interface_type = pyvisa.constants.InterfaceType.gpib
+        self.resource.enable_fast_tcp()
+        self.resource._resource.set_visa_attribute.assert_not_called()
+
+    @patch.object(ped.core, "_get_resource_manager")
+    def test_termination_settings_forwarded(self, rm_patch: MagicMock):
+        ped.VisaResource(
+            "TCPIP0::localhost::5025::SOCKET",
+            read_termination="\n",
+            write_termination="\n",
+            fast_tcp=False,
+        )
+        _, settings = rm_patch.return_value.open_resource.call_args
+        self.assertEqual(settings["read_termination"], "\n")
+        self.assertEqual(settings["write_termination"], "\n")
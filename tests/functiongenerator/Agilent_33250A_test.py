@@ -0,0 +1,38 @@
+import unittest
+
+import pytest
+
+from pythonequipmentdrivers.functiongenerator import Agilent_33250A
+
+
+class TestAgilent33250A(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def setup_driver(self, mock_driver):
+        self.fg = mock_driver(Agilent_33250A)
+
+    def test_setters_by_keyword(self):
+        # argument names of the original hand-written setters
+        calls = (
+            ("set_voltage_amplitude", {"voltage": 1}, "VOLT 1.0"),
+            ("set_voltage_offset", {"voltage": 0.5}, "VOLT:OFFS 0.5"),
+            ("set_voltage_high", {"voltage": 2}, "VOLT:HIGH 2.0"),
+            ("set_voltage_low", {"voltage": -2}, "VOLT:LOW -2.0"),
+            ("set_frequency", {"frequency": 1e3}, "FREQ 1000.0"),
+            ("set_pulse_period", {"period": 1e-3}, "PULSE:PER 0.001"),
+            ("set_pulse_width", {"width": 1e-4}, "PULSE:WIDT 0.0001"),
+            ("set_square_duty_cycle", {"dc": 25}, "FUNC:SQU:DCYCLE 25.0"),
+        )
+        for method, kwargs, message in calls:
+            with self.subTest(method=method):
+                self.fg._resource.reset_mock()
+                getattr(self.fg, method)(**kwargs)
+                self.fg._resource.write.assert_called_once_with(message=message)
+
+    def test_setter_positional(self):
+        self.fg.set_frequency(2e3)
+        self.fg._resource.write.assert_called_once_with(message="FREQ 2000.0")
+
+    def test_getter(self):
+        self.fg._resource.query.return_value = "1.0E+03"
+        self.assertEqual(1e3, self.fg.get_frequency())
+        self.fg._resource.query.assert_called_once_with(message="FREQ?")
@@ -0,0 +1,111 @@
+import unittest
+from time import sleep
+
+import pytest
+import pyvisa
+
+from pythonequipmentdrivers.functiongenerator import Keysight_33500B
+
+
+class TestKeysight33500B(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def setup_driver(self, mock_driver):
+        self.fg = mock_driver(Keysight_33500B)
+        self.written = self.fg._resource.written
+
+    def test_batch_merges_repeated_setting(self):
+        with self.fg.batch():
+            for frequency in (1e3, 2e3, 5e3):
+                self.fg.set_frequency(frequency)
+            self.fg.set_voltage_amplitude(2)
+        self.assertEqual(["SOUR1:FREQ 5000.0;:SOUR1:VOLT:AMPL 2"], self.written())
+
+    def test_batch_preserves_order(self):
+        with self.fg.batch():
+            self.fg.set_frequency(1000)
+            self.fg.set_voltage_amplitude(1)
+            self.fg.set_frequency(2000)
+        self.assertEqual(
+            ["SOUR1:FREQ 1000;:SOUR1:VOLT:AMPL 1;:SOUR1:FREQ 2000"], self.written()
+        )
+
+    def test_nowait(self):
+        with self.fg.nowait():
+            self.fg.set_frequency(1000)
+            self.fg.set_voltage_amplitude(1)
+        self.assertEqual(["SOUR1:FREQ 1000", "SOUR1:VOLT:AMPL 1"], self.written())
+        self.assertIsNone(self.fg._tx_futures)
+
+    def test_nowait_error_raised_by_sync(self):
+        self.fg._resource.write.side_effect = pyvisa.VisaIOError(-1073807339)
+        with self.assertRaises(IOError):
+            with self.fg.nowait():
+                self.fg.set_frequency(1000)
+        self.assertIsNone(self.fg._tx_futures)
+
+    def test_nowait_transfers_wait_for_writes(self):
+        self.fg._resource.write.side_effect = lambda **kwargs: sleep(0.05)
+        self.fg._resource.read.return_value = "1"
+        with self.fg.nowait():
+            self.fg.set_frequency(1000)
+            self.fg.read_resource()
+            self.fg.set_frequency(2000)
+            self.fg.query_resource_binary_values("DATA?")
+            self.fg.set_frequency(3000)
+            self.fg.write_resource_raw(b"*TRG")
+        self.assertEqual(
+            [
+                "write",
+                "read",
+                "write",
+                "query_binary_values",
+                "write",
+                "write_raw",
+            ],
+            [name for name, *_ in self.fg._resource.mock_calls],
+        )
+
+    def test_nowait_async_query(self):
+        self.fg._resource.query.return_value = "1000"
+        with self.fg.nowait():
+            self.fg.set_frequency(1000)
+            future = self.fg.query_resource_async("SOUR1:FREQ?")
+            self.assertEqual("1000", future.result(timeout=1))
+        self.assertEqual(
+            ["write", "query"], [name for name, *_ in self.fg._resource.mock_calls]
+        )
+
+
+class TestKeysight33500BRelativePaths(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def setup_driver(self, mock_driver):
+        self.fg = mock_driver(Keysight_33500B, strict_scpi_path=False)
+        self.written = self.fg._resource.written
+
+    def test_batch_shortens_paths(self):
+        with self.fg.batch():
+            self.fg.set_frequency(1000)
+            self.fg.set_voltage_amplitude(1)
+            self.fg.set_frequency(2000)
+        self.assertEqual(
+            ["SOUR1:FREQ 1000;VOLT:AMPL 1;:SOUR1:FREQ 2000"], self.written()
+        )
+
+    def test_extends_current_path(self):
+        message = self.fg._chain_commands(
+            ["SOUR1:VOLT:AMPL 1", "sour1:volt:offs 0", "SOUR1:VOLT:HIGH 2"]
+        )
+        self.assertEqual("SOUR1:VOLT:AMPL 1;offs 0;HIGH 2", message)
+
+    def test_different_path_is_absolute(self):
+        message = self.fg._chain_commands(["SOUR1:VOLT:AMPL 1", "OUTP1 ON"])
+        self.assertEqual("SOUR1:VOLT:AMPL 1;:OUTP1 ON", message)
+
+    def test_common_command_keeps_path(self):
+        message = self.fg._chain_commands(["SOUR1:FREQ 1000", "*TRG", "SOUR1:PHAS 90"])
+        self.assertEqual("SOUR1:FREQ 1000;*TRG;PHAS 90", message)
+
+    def test_strict_path_unchanged(self):
+        self.fg.strict_scpi_path = True
+        message = self.fg._chain_commands(["SOUR1:FREQ 1000", "SOUR1:PHAS 90"])
+        self.assertEqual("SOUR1:FREQ 1000;:SOUR1:PHAS 90", message)
@@ -0,0 +1,57 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+from pythonequipmentdrivers.multimeter import Fluke_45
+
+
+class TestFluke45Tables(unittest.TestCase):
+    def test_valid_modes(self):
+        self.assertSetEqual(
+            set(Fluke_45.valid_modes),
+            {"AAC", "ADC", "VAC", "VDC", "OHMS", "FREQ", "CONT"},
+        )
+
+    def test_range_lut_modes(self):
+        modes_with_ranges = {mode for mode, _ in Fluke_45._range_lut}
+        self.assertTrue(modes_with_ranges <= Fluke_45.valid_modes)
+        self.assertIn("OHMS", modes_with_ranges)
+
+    def test_range_lut_sorted(self):
+        for max_values, _ in Fluke_45._range_lut.values():
+            self.assertEqual(list(max_values), sorted(max_values))
+
+
+class TestFluke45FetchDataMany(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def setup_driver(self, mock_driver):
+        self.dmm = mock_driver(
+            Fluke_45, factor=1.0, _is_serial=False, _io_lock=threading.RLock()
+        )
+        self.dmm._resource.query.side_effect = lambda message: ";".join(
+            ["1.5"] * message.count("VAL?")
+        )
+
+    def test_triggers_each_sample(self):
+        self.dmm._max_queries_per_line = 2
+        data = self.dmm.fetch_data_many(3)
+        self.assertListEqual(
+            ["*TRG;VAL?;*TRG;VAL?", "*TRG;VAL?"], self.dmm._resource.queried()
+        )
+        self.assertListEqual(list(data), [1.5, 1.5, 1.5])
+
+
+class TestFluke45Connection(unittest.TestCase):
+    @patch("pythonequipmentdrivers.core._get_resource_manager")
+    def test_non_canonical_address(self, get_rm):
+        rm = get_rm.return_value
+        resource = rm.open_resource.return_value
+        resource.resource_name = "TCPIP0::1.2.3.4::inst0::INSTR"
+        rm.list_opened_resources.return_value = [resource]
+        resource.query.return_value = "FLUKE, 45"
+
+        dmm = Fluke_45("TCPIP::1.2.3.4::INSTR")
+        self.assertIs(resource, dmm._resource)
+        self.assertEqual(65536, resource.chunk_size)
@@ -0,0 +1,23 @@
+import unittest
+
+import pytest
+
+from pythonequipmentdrivers.multimeter import Fluke_DMM
+
+
+class TestFlukeDMMRange(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def setup_driver(self, mock_driver):
+        self.dmm = mock_driver(Fluke_DMM)
+
+    def test_valid_ranges(self):
+        for n in range(1, 8):
+            with self.subTest(n=n):
+                self.dmm.set_range(n)
+                self.dmm._resource.write.assert_called_with(message=f"RANGE {n}")
+
+    def test_invalid_ranges(self):
+        for n in (0, 8):
+            with self.subTest(n=n):
+                with self.assertRaisesRegex(ValueError, "1-7"):
+                    self.dmm.set_range(n)
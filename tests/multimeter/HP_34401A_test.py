@@ -0,0 +1,96 @@
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+from pythonequipmentdrivers.multimeter import HP_34401A
+
+
+class TestHP34401A(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def setup_driver(self, mock_driver):
+        self.dmm = mock_driver(HP_34401A, factor=1.0)
+        self.dmm.invalidate_cache()
+        self.written = self.dmm._resource.written
+        self.queried = self.dmm._resource.queried
+
+    def test_measure_wrong_mode(self):
+        self.dmm._resource.query.return_value = '"CURR"'
+        for _ in range(2):  # the mismatch must not be cached as configured
+            with self.assertRaises(IOError):
+                self.dmm.measure_voltage()
+        self.assertEqual(["FUNC?"], self.queried())  # nothing reconfigured
+
+    def test_measure_unknown_mode(self):
+        self.dmm._resource.query.side_effect = ['"VOLT"', "1.5"]
+        self.assertEqual(1.5, self.dmm.measure_voltage())
+        self.assertEqual(["FUNC?", "MEAS:VOLT:DC?"], self.queried())
+
+    def test_resp_format_float_list(self):
+        self.assertEqual([1.5, -2.0], self.dmm.resp_format("+1.5E+00,-2.0E+00", float))
+        self.assertEqual(1.5, self.dmm.resp_format("+1.5E+00", float))
+
+    def test_resp_format_malformed(self):
+        with self.assertRaises(ValueError):
+            self.dmm.resp_format("+1.5E+00,ERR,-2.0E+00", float)
+
+    def test_assign_cached_settings(self):
+        self.dmm.sample_count = 10
+        self.dmm.trigger_count = 2
+        self.dmm.trigger_mode = "BUS"
+        self.assertEqual(10, self.dmm.sample_count)
+        self.assertEqual(2, self.dmm.trigger_count)
+        self.assertEqual("BUS", self.dmm.trigger_mode)
+        self.assertEqual([], self.queried())
+
+    def test_measure_time_estimated(self):
+        self.dmm.nplc_default = 1
+        self.dmm.line_frequency = 50.0
+        self.dmm._resource.query.return_value = "+1.00000000E+01"
+        self.assertAlmostEqual(10 * (1 / 50) + 0.01, self.dmm.measure_time)
+        self.assertEqual(["SAMP:COUN?"], self.queried())
+        self.dmm.set_measure_time(1.5)
+        self.assertEqual(1.5, self.dmm.measure_time)
+
+    def test_config_auto_range(self):
+        self.dmm.config("volt", signal_range="auto")
+        self.assertEqual(["CONF:VOLT:DC;:SENS:VOLT:DC:NPLC 0.02"], self.written())
+        self.assertEqual(0.02, self.dmm._nplc)
+
+    def test_config_auto_range_resolution(self):
+        self.dmm.config("volt", signal_range="AUTO", resolution=0.001)
+        self.assertEqual(["CONF:VOLT:DC;:SENS:VOLT:DC:RES 0.001"], self.written())
+
+    def test_config_range_resolution(self):
+        self.dmm.config("volt", signal_range=10, resolution=0.001)
+        self.assertEqual(["CONF:VOLT:DC 10,0.001"], self.written())
+
+    def test_config_unlisted_range_uses_max(self):
+        self.dmm.config("curr", signal_range=5, nplc=1)
+        self.assertEqual(["CONF:CURR:DC MAX;:SENS:CURR:DC:NPLC 1"], self.written())
+
+    def test_config_ac_skips_nplc(self):
+        self.dmm.config("volt", acdc="ac", nplc=10)
+        self.assertEqual(["CONF:VOLT:AC"], self.written())
+        self.assertIsNone(self.dmm._nplc)
+
+    def test_config_freq_skips_nplc_and_resolution(self):
+        self.dmm.config("freq", resolution=0.001)
+        self.assertEqual(["CONF:FREQ"], self.written())
+        self.assertIsNone(self.dmm._nplc)
+
+    def test_display_state_cached_within_ttl(self):
+        self.dmm._resource.query.return_value = "1"
+        self.assertTrue(self.dmm.get_display_state())
+        self.assertTrue(self.dmm.get_display_state())
+        self.assertEqual(["DISP?"], self.queried())
+
+    @patch("pythonequipmentdrivers.multimeter.HP_34401A.monotonic")
+    def test_display_state_expires(self, monotonic):
+        monotonic.return_value = 0.0
+        self.dmm.set_display_state(False)
+        self.dmm._resource.query.return_value = "1"  # changed on the panel
+        self.assertFalse(self.dmm.get_display_state())
+        monotonic.return_value = 1.0  # older than display_cache_ttl
+        self.assertTrue(self.dmm.get_display_state())
+        self.assertEqual(["DISP?"], self.queried())